@@ -2,7 +2,7 @@
 # All Rights Reserved
 
 from __future__ import annotations
-import json, re, sys, threading, time, logging
+import json, os, re, sys, threading, time, logging
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -20,9 +20,10 @@ from archi3d.utils.uploads import upload_file_safely
 # A..Z ordering helper (mirrors the Tripo3D adapter logic you approved)
 _SUFFIX_RE = re.compile(r"_([A-Z])(?:\.[^.]+)$", re.IGNORECASE)
 def _order_by_letter(files: List[str]) -> List[int]:
+    search = _SUFFIX_RE.search
     def key(idx: int) -> Tuple[int, str]:
-        name = Path(files[idx]).name
-        m = _SUFFIX_RE.search(name)
+        name = os.path.basename(files[idx])  # avoids a Path object per file
+        m = search(name)
         if m:
             rank = ord(m.group(1).upper()) - ord("A")
             if 0 <= rank <= 25:
@@ -2,7 +2,7 @@
 # All Rights Reserved
 
 from __future__ import annotations
-import json, re, threading, time, sys, logging
+import json, os, re, threading, time, sys, logging
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -21,9 +21,10 @@ _SUFFIX_RE = re.compile(r"_([A-Z])(?:\.[^.]+)$", re.IGNORECASE)
 
 def _order_by_letter(files: List[str]) -> List[int]:
     """Return indices that sort files by trailing letter A..Z if present; else stable by name."""
+    search = _SUFFIX_RE.search
     def key(idx: int) -> Tuple[int, str]:
-        name = Path(files[idx]).name
-        m = _SUFFIX_RE.search(name)
+        name = os.path.basename(files[idx])  # avoids a Path object per file
+        m = search(name)
         if m:
             # Map A..Z -> 0..25; anything else to large number
             rank = ord(m.group(1).upper()) - ord("A")
@@ -4,6 +4,7 @@
 # archi3d/cli.py
 from __future__ import annotations
 
+import os
 import sys
 from datetime import UTC
 from pathlib import Path
@@ -230,7 +231,13 @@ def catalog_consolidate():
     staging_dir = paths.results_staging_dir()
     main_results_path = paths.results_parquet
 
-    staged_files = list(staging_dir.glob("*.parquet"))
+    # One directory read with a plain suffix test instead of glob's per-name
+    # fnmatch (hidden files are skipped, as "*" would)
+    with os.scandir(staging_dir) as entries:
+        staged_files = [
+            Path(e.path) for e in entries
+            if e.name.endswith(".parquet") and not e.name.startswith(".")
+        ]
 
     if not staged_files:
         console.print("[yellow]No new results found in the staging area to consolidate.[/yellow]")
@@ -238,9 +245,14 @@ def catalog_consolidate():
 
     console.print(f"Found {len(staged_files)} new result file(s) to consolidate.")
 
-    # Read all staged files into a list of DataFrames
-    df_list = [pd.read_parquet(f) for f in staged_files]
-    new_results_df = pd.concat(df_list, ignore_index=True)
+    # Read the staged files as Arrow tables and convert to pandas once;
+    # building one DataFrame per file dominates with many small fragments
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    new_results_df = pa.concat_tables(
+        [pq.read_table(f) for f in staged_files], promote_options="permissive"
+    ).to_pandas()
 
     # Use the results lock to safely update the main file
     lock_path = paths.results_lock_path()
@@ -293,6 +305,11 @@ def batch_create(
     exclude: str | None = typer.Option(None, "--exclude", help="Exclude filter (substring match)"),
     with_gt_only: bool = typer.Option(False, "--with-gt-only", help="Skip items without GT object"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Compute summary without writing files"),
+    manifest_format: str = typer.Option(
+        "csv",
+        "--manifest-format",
+        help="Run manifest format: 'csv' or 'parquet' (parquet also keeps manifest.csv)",
+    ),
 ):
     """
     Create a batch of jobs for one or more algorithms.
@@ -356,6 +373,7 @@ def batch_create(
             with_gt_only=with_gt_only,
             dry_run=dry_run,
             algo_by_images=algo_by_images,
+            manifest_format=manifest_format,
         )
     except Exception as e:
         import traceback
@@ -370,7 +388,8 @@ def batch_create(
     if not dry_run:
         console.print("\n[green]Batch creation complete![/green]")
         console.print(f"  Generations CSV: {paths.generations_csv_path()}")
-        console.print(f"  Manifest: {paths.run_root(run_id) / 'manifest.csv'}")
+        manifest_name = "manifest.parquet" if manifest_format == "parquet" else "manifest.csv"
+        console.print(f"  Manifest: {paths.run_root(run_id) / manifest_name}")
         console.print(f"  Log: {paths.batch_create_log_path()}")
     else:
         console.print("\n[yellow]Dry-run complete (no files written)[/yellow]")
@@ -402,7 +421,7 @@ def batch_create(
 @run_app.command("worker")
 def run_worker_cmd(
     run_id: str = typer.Option(..., "--run-id", help="Run identifier (required)"),
-    jobs: str | None = typer.Option(None, "--jobs", help="Filter job_id by substring/regex"),
+    jobs: str | None = typer.Option(None, "--jobs", help="Filter job_id by glob/regex/substring"),
     only_status: str = typer.Option(
         "enqueued", "--only-status", help="Comma-separated statuses to process (default: enqueued)"
     ),
@@ -419,6 +438,11 @@ def run_worker_cmd(
     redo: bool = typer.Option(
         False, "--redo", help="Clear state markers and retry selected jobs"
     ),
+    executor: str = typer.Option(
+        "thread",
+        "--executor",
+        help="Job pool: 'thread' (default) or 'process' (for CPU-bound adapters)",
+    ),
 ):
     """
     Execute generation jobs from tables/generations.csv for a given run.
@@ -448,7 +472,8 @@ def run_worker_cmd(
         f"Adapter override: {adapter or '---'}\n"
         f"Dry-run: {dry_run}\n"
         f"Fail-fast: {fail_fast}\n"
-        f"Redo: {redo}"
+        f"Redo: {redo}\n"
+        f"Executor: {executor}"
     )
     console.print(Panel.fit(panel_text))
 
@@ -463,6 +488,7 @@ def run_worker_cmd(
             dry_run=dry_run,
             fail_fast=fail_fast,
             redo=redo,
+            executor_kind=executor,
         )
     except Exception as e:  # noqa: BLE001
         import traceback
@@ -2,15 +2,23 @@
 # All Rights Reserved
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 import yaml
 import sys
 
 
-def load_adapters_cfg() -> dict:
+# libyaml-backed loader when available (same safe semantics, much faster)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _adapters_yaml_path(cwd: str) -> Path:
     """
-    Loads the adapters configuration, handling both development
+    Resolve the adapters.yaml location, handling both development
     and bundled (PyInstaller) environments.
+
+    Cached per working directory, since repo-root discovery walks up from cwd.
     """
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # --- Running in a PyInstaller Bundle ---
@@ -19,18 +27,41 @@ def load_adapters_cfg() -> dict:
         # The path inside the bundle is determined by your --add-data flag.
         # Your command uses: --add-data ".\src\archi3d\config\adapters.yaml;archi3d\config"
         # This means the file is located at: <base_path>/archi3d/config/adapters.yaml
-        p = base_path / "archi3d" / "config" / "adapters.yaml"
-    else:
-        # --- Running in a normal development environment ---
-        # Find the repo root by searching for pyproject.toml
-        # Note: This requires importing _find_repo_root, but we do it locally
-        # to avoid circular dependency issues at the top level.
-        from archi3d.config.loader import _find_repo_root
-        repo_root = _find_repo_root()
-        p = repo_root / "src" / "archi3d" / "config" / "adapters.yaml"
-
-    with p.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+        return base_path / "archi3d" / "config" / "adapters.yaml"
+
+    # --- Running in a normal development environment ---
+    # Find the repo root by searching for pyproject.toml
+    # Note: This requires importing _find_repo_root, but we do it locally
+    # to avoid circular dependency issues at the top level.
+    from archi3d.config.loader import _find_repo_root
+    repo_root = _find_repo_root(Path(cwd))
+    return repo_root / "src" / "archi3d" / "config" / "adapters.yaml"
+
+
+@lru_cache(maxsize=8)
+def _parse_adapters_yaml(path: Path, mtime_ns: int) -> dict:
+    """Parse adapters.yaml; cached per (path, mtime) so edits are still picked up."""
+    with path.open("r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_SafeLoader) or {}
+
+
+def load_adapters_cfg() -> dict:
+    """
+    Loads the adapters configuration, handling both development
+    and bundled (PyInstaller) environments.
+
+    Path resolution and parsing are cached, so repeated calls (one per
+    algorithm during batch creation) cost a single stat. The returned dict
+    is shared between callers and must be treated as read-only.
+    """
+    p = _adapters_yaml_path(str(Path.cwd()))
+    return _parse_adapters_yaml(p, p.stat().st_mtime_ns)
+
+
+def clear_adapters_cfg_cache() -> None:
+    """Drop cached adapters.yaml paths and contents (e.g. between tests)."""
+    _adapters_yaml_path.cache_clear()
+    _parse_adapters_yaml.cache_clear()
 
 
 def get_adapter_image_mode(adapter_key: str) -> str:
@@ -44,6 +44,7 @@ class PathResolver:
 
         # Canonical table files (created by commands when needed)
         self.items_csv: Path = self.tables_dir / "items.csv"
+        self.items_parquet: Path = self.tables_dir / "items.parquet"
         self.results_parquet: Path = self.tables_dir / "results.parquet"
 
     # -------------------------
@@ -170,6 +171,10 @@ class PathResolver:
         """Path to the canonical items catalog CSV."""
         return self.tables_dir / "items.csv"
 
+    def items_parquet_path(self) -> Path:
+        """Path to the columnar copy of the items catalog (read by batch create)."""
+        return self.tables_dir / "items.parquet"
+
     def items_issues_csv_path(self) -> Path:
         """Path to the items issues/validation CSV."""
         return self.tables_dir / "items_issues.csv"
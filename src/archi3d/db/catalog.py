@@ -5,13 +5,14 @@
 """
 Phase 1: Catalog Build
 Scans the curated dataset folder and enriches with products-with-3d.json metadata.
-Writes canonical tables/items.csv and tables/items_issues.csv (SSOT for parent items).
+Writes canonical tables/items.csv and tables/items_issues.csv (SSOT for parent items),
+plus tables/items.parquet, a columnar copy of items.csv used by batch creation.
 """
 from __future__ import annotations
 
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -19,12 +20,11 @@ from typing import Any
 import pandas as pd
 
 from archi3d.config.paths import PathResolver
-from archi3d.utils.io import append_log_record
+from archi3d.utils.io import append_log_record, write_csv_arrow
 
 # --- Constants ---
 
 _FOLDER_NAME_RE = re.compile(r"^(?P<pid>\d+)(?:\s*-\s*(?P<variant>.+))?$")
-_SUFFIX_TAG_RE = re.compile(r"_(?P<tag>[A-F])(?:\.[^.]+)$", re.IGNORECASE)
 
 _IMAGE_EXTS = {".jpg", ".jpeg", ".png"}
 _GT_EXTENSIONS_PRIORITY = [".glb", ".fbx"]  # Prefer .glb over .fbx
@@ -34,8 +34,9 @@ _MAX_CATEGORIES = 3
 
 
 # --- Data Structures ---
+# One instance per catalog row: slots keep them free of a per-instance __dict__
 
-@dataclass
+@dataclass(slots=True)
 class CatalogIssue:
     """Represents an issue found during catalog building."""
     product_id: str
@@ -44,7 +45,7 @@ class CatalogIssue:
     detail: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogItem:
     """Represents a single catalog item (product + variant)."""
     product_id: str
@@ -70,6 +71,20 @@ class CatalogItem:
 
 # --- Helper Functions ---
 
+def _records_frame(records: list[Any], record_type: type) -> pd.DataFrame:
+    """
+    Build a DataFrame column by column from dataclass records.
+
+    Columns follow the dataclass field order (also for an empty list), and
+    each column is one list, so pandas infers dtypes once per column instead
+    of walking a dict per row.
+    """
+    names = [f.name for f in fields(record_type)]
+    return pd.DataFrame(
+        {name: [getattr(r, name) for r in records] for name in names}, columns=names
+    )
+
+
 def _parse_folder_name(folder_name: str) -> tuple[str, str]:
     """
     Parse folder name into (product_id, variant).
@@ -90,6 +105,23 @@ def _parse_folder_name(folder_name: str) -> tuple[str, str]:
     return pid, variant if variant else "default"
 
 
+def _image_tag(stem: str) -> str | None:
+    """
+    Return the _A.._F tag found in an image file stem, or None if untagged.
+
+    Same result as searching the stem for r"_([A-F])\\.[^.]+$"
+    (case-insensitive), with plain index arithmetic instead of a regex: the
+    tag must be followed by a further ".suffix" inside the stem, so
+    "photo_b.v2" -> "B" while "photo_B" -> None.
+    """
+    dot = stem.rfind(".")
+    if 2 <= dot < len(stem) - 1 and stem[dot - 2] == "_":
+        tag = stem[dot - 1].upper()
+        if "A" <= tag <= "F":
+            return tag
+    return None
+
+
 def _collect_and_sort_images(images_dir: Path) -> tuple[list[Path], list[str]]:
     """
     Collect and sort images according to Phase 1 rules:
@@ -123,13 +155,9 @@ def _collect_and_sort_images(images_dir: Path) -> tuple[list[Path], list[str]]:
     untagged: list[Path] = []
 
     for img_path in all_images:
-        match = _SUFFIX_TAG_RE.search(img_path.stem)  # Search in stem (before extension)
-        if match:
-            tag = match.group("tag").upper()
-            if "A" <= tag <= "F":
-                tagged.append((tag, img_path))
-            else:
-                untagged.append(img_path)
+        tag = _image_tag(img_path.stem)  # Search in stem (before extension)
+        if tag:
+            tagged.append((tag, img_path))
         else:
             untagged.append(img_path)
 
@@ -513,7 +541,7 @@ def build_catalog(
 
     # Write items.csv atomically
     items_csv_path = paths.items_csv_path()
-    items_df = pd.DataFrame([vars(item) for item in catalog_items])
+    items_df = _records_frame(catalog_items, CatalogItem)
 
     # Ensure product_id and variant are strings (prevent pandas from converting to int)
     if len(items_df) > 0:
@@ -522,25 +550,46 @@ def build_catalog(
 
     # Write atomically using temp file + rename
     tmp_path = items_csv_path.with_suffix(items_csv_path.suffix + ".tmp")
-    items_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    write_csv_arrow(items_df, tmp_path)
     tmp_path.replace(items_csv_path)
 
+    # Columnar copy for batch creation (column projection, no string re-parsing).
+    # Written after items.csv so its mtime marks it as current.
+    items_parquet_path = paths.items_parquet_path()
+    parquet_written = False
+    if len(items_df) > 0:
+        import pyarrow as pa  # noqa: PLC0415
+
+        tmp_path = items_parquet_path.with_suffix(items_parquet_path.suffix + ".tmp")
+        try:
+            items_df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # A column mixing value types (e.g. a numeric manufacturer name
+            # in the products JSON): batch creation reads items.csv instead
+            tmp_path.unlink(missing_ok=True)
+        else:
+            tmp_path.replace(items_parquet_path)
+            parquet_written = True
+    if not parquet_written:
+        # Never leave a stale copy that would shadow the new items.csv
+        items_parquet_path.unlink(missing_ok=True)
+
     # Write items_issues.csv atomically
     issues_csv_path = paths.items_issues_csv_path()
     if all_issues:
-        issues_df = pd.DataFrame([vars(issue) for issue in all_issues])
+        issues_df = _records_frame(all_issues, CatalogIssue)
         # Ensure product_id and variant are strings
         issues_df["product_id"] = issues_df["product_id"].astype(str)
         issues_df["variant"] = issues_df["variant"].astype(str)
 
         tmp_issues_path = issues_csv_path.with_suffix(issues_csv_path.suffix + ".tmp")
-        issues_df.to_csv(tmp_issues_path, index=False, encoding="utf-8-sig")
+        write_csv_arrow(issues_df, tmp_issues_path)
         tmp_issues_path.replace(issues_csv_path)
     else:
         # Write empty CSV with headers
         empty_df = pd.DataFrame(columns=["product_id", "variant", "issue", "detail"])
         tmp_issues_path = issues_csv_path.with_suffix(issues_csv_path.suffix + ".tmp")
-        empty_df.to_csv(tmp_issues_path, index=False, encoding="utf-8-sig")
+        write_csv_arrow(empty_df, tmp_issues_path)
         tmp_issues_path.replace(issues_csv_path)
 
     # Write structured log summary
@@ -580,6 +629,8 @@ def build_catalog(
     print(f"  Issues: {len(all_issues)}")
     print("\nOutput files:")
     print(f"  {items_csv_path}")
+    if parquet_written:
+        print(f"  {items_parquet_path}")
     print(f"  {issues_csv_path}")
     print(f"  {log_path}")
 
@@ -9,15 +9,19 @@ and atomic upserts to the generations SSOT table.
 """
 
 import hashlib
+from collections.abc import Iterable
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 from archi3d.utils.io import update_csv_atomic
 
 
-def compute_image_set_hash(image_paths: List[str]) -> str:
+def compute_image_set_hash(image_paths: list[str]) -> str:
     """
     Compute deterministic SHA1 hash of an ordered list of image paths.
 
@@ -62,9 +66,53 @@ def compute_job_id(product_id: str, variant: str, algo: str, image_set_hash: str
     return full_hash[:12]
 
 
+def compute_image_set_hashes(image_lists: Iterable[list[str]]) -> list[str]:
+    """
+    Batch form of compute_image_set_hash() for many ordered image lists.
+
+    Args:
+        image_lists: Iterable of workspace-relative image path lists.
+
+    Returns:
+        One 40-character hex SHA1 hash per input list, in order.
+    """
+    sha1 = hashlib.sha1
+    return [sha1("\n".join(paths).encode("utf-8")).hexdigest() for paths in image_lists]
+
+
+def compute_job_ids(
+    product_ids: pd.Series,
+    variants: pd.Series,
+    algos: pd.Series,
+    image_set_hashes: pd.Series,
+) -> list[str]:
+    """
+    Batch form of compute_job_id() over aligned columns.
+
+    The pipe-joined composite strings are built with one pandas string
+    concatenation and encoded once; only the SHA1 digests run per row, and
+    only the 6 bytes behind the 12 kept hex digits are hex-encoded.
+
+    Args:
+        product_ids: Product identifiers.
+        variants: Variant names.
+        algos: Algorithm keys.
+        image_set_hashes: Full 40-char SHA1 hashes from compute_image_set_hash().
+
+    Returns:
+        12-character hex job IDs, identical to compute_job_id() row by row.
+    """
+    composite = product_ids.astype(str).str.cat(
+        [variants.astype(str), algos.astype(str), image_set_hashes.astype(str)],
+        sep="|",
+    )
+    sha1 = hashlib.sha1
+    return [sha1(b).digest()[:6].hex() for b in composite.str.encode("utf-8")]
+
+
 def upsert_generations(
     generations_csv_path: Path,
-    df_new: pd.DataFrame,
+    df_new: "pd.DataFrame | pa.Table",
 ) -> tuple[int, int]:
     """
     Atomically upsert rows into tables/generations.csv.
@@ -74,7 +122,7 @@ def upsert_generations(
 
     Args:
         generations_csv_path: Absolute path to tables/generations.csv.
-        df_new: DataFrame with generation records to upsert.
+        df_new: DataFrame (or pyarrow Table) with generation records to upsert.
                 Must contain columns: run_id, job_id, status, created_at, etc.
 
     Returns:
@@ -83,6 +131,9 @@ def upsert_generations(
     Raises:
         ValueError: If df_new is missing required key columns.
     """
+    if not isinstance(df_new, pd.DataFrame):
+        df_new = df_new.to_pandas()
+
     # Validate key columns present
     key_cols = ["run_id", "job_id"]
     missing = set(key_cols) - set(df_new.columns)
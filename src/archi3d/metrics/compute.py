@@ -5,9 +5,9 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Optional
 
 import pandas as pd
 from filelock import FileLock
@@ -17,7 +17,30 @@ from archi3d.config.paths import PathResolver
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(UTC).isoformat()
+
+
+# Upper bound on concurrent sidecar writes (each is an independent small file)
+_MAX_WRITE_THREADS = 32
+
+
+# results.parquet columns read to select rows and build sidecar payloads
+_SIDECAR_SOURCE_COLS = [
+    "run_id", "status", "algo", "job_id", "product_id",
+    "n_images", "img_suffixes", "output_glb_relpath",
+]
+
+
+def _write_sidecars(sidecars: dict[Path, str]) -> None:
+    """Write all metrics sidecars concurrently (I/O bound, one file each)."""
+    if not sidecars:
+        return
+    workers = min(_MAX_WRITE_THREADS, len(sidecars))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() drains the iterator so write errors propagate here
+        list(executor.map(
+            lambda item: item[0].write_text(item[1], encoding="utf-8"), sidecars.items()
+        ))
 
 
 def _ensure_metric_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -29,20 +52,21 @@ def _ensure_metric_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _metrics_json_path(paths: PathResolver, run_id: str, output_glb_relpath: str) -> Path:
+def _metrics_json_path(metrics_dir: Path, output_glb_relpath: str) -> Path:
     """
     Derive metrics JSON filename from the GLB artifact name.
     GLB relpath looks like: runs/<run_id>/outputs/<algo>/<core>.glb
     Metrics JSON lives at:  runs/<run_id>/metrics/<core>.json
+    (metrics_dir is paths.metrics_dir(run_id), resolved once per pass)
     """
     glb_name = Path(output_glb_relpath).name
     json_name = Path(glb_name).with_suffix(".json")
-    return paths.metrics_dir(run_id) / json_name
+    return metrics_dir / json_name
 
 
 def run(
     run_id: str,
-    algo: Optional[str],
+    algo: str | None,
     recompute: bool,
     paths: PathResolver,
 ) -> int:
@@ -62,22 +86,31 @@ def run(
             "Run at least one worker to create it."
         )
 
-    df = pd.read_parquet(parquet_path)
-    if df.empty:
-        return 0
+    # Read only the rows to touch and the columns the sidecars need; the row
+    # filters are pushed down to the parquet reader (row-group statistics).
+    import pyarrow.parquet as pq  # noqa: PLC0415
 
-    # Filter rows
-    mask = (df["run_id"] == run_id) & (df["status"] == "completed")
+    present = set(pq.read_schema(parquet_path).names)
+    filters = [("run_id", "==", run_id), ("status", "==", "completed")]
     if algo:
-        mask &= df["algo"] == algo
-    work = df[mask].copy()
+        filters.append(("algo", "==", algo))
+    work = pd.read_parquet(
+        parquet_path,
+        engine="pyarrow",
+        columns=[c for c in _SIDECAR_SOURCE_COLS if c in present],
+        filters=filters,
+    )
     if work.empty:
         return 0
 
-    # Ensure metric columns exist in full DF
-    df = _ensure_metric_columns(df)
-
     updated = 0
+    # Per-pass invariants bound once: one timestamp for all sidecars, the
+    # metrics dir (metrics_dir() mkdirs on every call) and the code version
+    computed_at = _now_iso()
+    metrics_dir = paths.metrics_dir(run_id)
+    code_version = __version__
+    # Sidecar payloads by path, written together after the scan (last row wins)
+    sidecars: dict[Path, str] = {}
 
     for idx, row in work.iterrows():
         output_rel = row.get("output_glb_relpath", "") or ""
@@ -85,9 +118,12 @@ def run(
             # No artifact path → nothing to write a sidecar for
             continue
 
-        mpath = _metrics_json_path(paths, run_id, output_rel)
+        mpath = _metrics_json_path(metrics_dir, output_rel)
 
-        # Skip if already computed and not recomputing
+        # Skip if already computed and not recomputing (including sidecars
+        # queued earlier in this pass, which carry computed_at)
+        if mpath in sidecars and not recompute:
+            continue
         if mpath.exists() and not recompute:
             try:
                 payload = json.loads(mpath.read_text(encoding="utf-8"))
@@ -105,21 +141,26 @@ def run(
             "n_images": int(row.get("n_images", 0)) if row.get("n_images", "") != "" else 0,
             "image_suffixes": row.get("img_suffixes", ""),
             "run_id": run_id,
-            "code_version": __version__,
+            "code_version": code_version,
             "lpips": None,
             "fscore": None,
-            "computed_at": _now_iso(),
+            "computed_at": computed_at,
         }
-        mpath.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Compact JSON: sidecars are machine-read (the file name identifies them)
+        sidecars[mpath] = json.dumps(payload, separators=(",", ":"))
 
         # Ensure DF has placeholder columns; do not change values (remain None)
         # Touching DF only to guarantee schema; no per-row value update needed now.
         updated += 1
 
-    # Persist DF (only if we ensured new columns or touched anything)
+    _write_sidecars(sidecars)
+
+    # Persist DF with the metric columns ensured (only if we touched anything).
+    # The full table is loaded only here, under the lock.
     if updated > 0:
         lock_path = parquet_path.with_suffix(".parquet.lock")
         with FileLock(str(lock_path)):
+            df = _ensure_metric_columns(pd.read_parquet(parquet_path))
             df.to_parquet(parquet_path, index=False)
 
     return updated
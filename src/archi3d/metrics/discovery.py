@@ -24,6 +24,7 @@ import importlib.util
 import logging
 import os
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Literal
 
 from archi3d.metrics.fscore_adapter import (
@@ -207,31 +208,68 @@ def _discover_vfscore_adapter(
     )
 
 
+@lru_cache(maxsize=8)
+def _resolve_fscore_adapter(
+    impl_env: str | None, cli_env: str | None
+) -> Callable[[FScoreRequest], FScoreResponse | None]:
+    """
+    Discover the FScore adapter once per environment configuration.
+
+    The arguments are the ARCHI3D_FSCORE_IMPL/ARCHI3D_FSCORE_CLI values and
+    only serve as cache key, so a changed environment triggers a new
+    discovery. Failures are not cached.
+    """
+    adapter_fn, mode = _discover_fscore_adapter()
+    logger.info(f"Using FScore adapter mode: {mode}")
+    return adapter_fn
+
+
+@lru_cache(maxsize=8)
+def _resolve_vfscore_adapter(
+    impl_env: str | None, cli_env: str | None
+) -> Callable[[VFScoreRequest], VFScoreResponse | None]:
+    """VFScore counterpart of _resolve_fscore_adapter."""
+    adapter_fn, mode = _discover_vfscore_adapter()
+    logger.info(f"Using VFScore adapter mode: {mode}")
+    return adapter_fn
+
+
+def clear_adapter_cache() -> None:
+    """Forget resolved adapters (e.g. after installing a metric package)."""
+    _resolve_fscore_adapter.cache_clear()
+    _resolve_vfscore_adapter.cache_clear()
+
+
 def get_fscore_adapter() -> Callable[[FScoreRequest], FScoreResponse | None]:
     """
     Get FScore adapter function.
 
+    Discovery (module lookup, entry-point scan) runs once per environment
+    configuration; evaluate_fscore calls this for every job.
+
     Returns:
         Adapter function taking FScoreRequest and returning FScoreResponse or None
 
     Raises:
         AdapterNotFoundError: No implementation available with actionable message
     """
-    adapter_fn, mode = _discover_fscore_adapter()
-    logger.info(f"Using FScore adapter mode: {mode}")
-    return adapter_fn
+    return _resolve_fscore_adapter(
+        os.getenv("ARCHI3D_FSCORE_IMPL"), os.getenv("ARCHI3D_FSCORE_CLI")
+    )
 
 
 def get_vfscore_adapter() -> Callable[[VFScoreRequest], VFScoreResponse | None]:
     """
     Get VFScore adapter function.
 
+    Discovery runs once per environment configuration (see get_fscore_adapter).
+
     Returns:
         Adapter function taking VFScoreRequest and returning VFScoreResponse or None
 
     Raises:
         AdapterNotFoundError: No implementation available with actionable message
     """
-    adapter_fn, mode = _discover_vfscore_adapter()
-    logger.info(f"Using VFScore adapter mode: {mode}")
-    return adapter_fn
+    return _resolve_vfscore_adapter(
+        os.getenv("ARCHI3D_VFSCORE_IMPL"), os.getenv("ARCHI3D_VFSCORE_CLI")
+    )
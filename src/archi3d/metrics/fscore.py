@@ -19,7 +19,6 @@ Key responsibilities:
 
 import json
 import logging
-import re
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
@@ -31,6 +30,7 @@ from archi3d.config.loader import load_config
 from archi3d.config.paths import PathResolver
 from archi3d.metrics.fscore_adapter import FScoreRequest, FScoreResponse, evaluate_fscore
 from archi3d.utils.io import append_log_record, update_csv_atomic
+from archi3d.utils.text import job_filter_regex
 
 logger = logging.getLogger(__name__)
 
@@ -50,50 +50,13 @@ def _configure_fscore_logging():
         fscore_logger.propagate = False  # Don't propagate to root logger
 
 
-def _job_matches_filter(job_id: str, filter_pattern: str) -> bool:
-    """
-    Check if job_id matches the filter pattern.
-
-    Supports:
-    - Substring matching (contains)
-    - Simple glob patterns (* wildcard)
-    - Regex patterns (if pattern starts with 're:')
-
-    Args:
-        job_id: Job ID to test
-        filter_pattern: Filter pattern string
-
-    Returns:
-        True if job_id matches filter, False otherwise
-    """
-    if not filter_pattern:
-        return True
-
-    # Regex pattern
-    if filter_pattern.startswith("re:"):
-        pattern = filter_pattern[3:]
-        try:
-            return bool(re.search(pattern, job_id))
-        except re.error:
-            logger.warning(f"Invalid regex pattern: {pattern}")
-            return False
-
-    # Glob pattern
-    if "*" in filter_pattern:
-        pattern = filter_pattern.replace("*", ".*")
-        return bool(re.match(pattern, job_id))
-
-    # Substring matching
-    return filter_pattern in job_id
-
-
 def _is_eligible(
     row: pd.Series,
     run_id: str,
     only_status: list[str],
     with_gt_only: bool,
     redo: bool,
-    jobs_filter: str | None,
+    job_id_matches: bool,
     paths: PathResolver,
 ) -> tuple[bool, str]:
     """
@@ -105,7 +68,7 @@ def _is_eligible(
         only_status: Allowed job statuses
         with_gt_only: Require GT object path
         redo: Force recomputation even if already done
-        jobs_filter: Optional job ID filter pattern
+        job_id_matches: Whether job_id passes the --jobs filter (True if unset)
         paths: PathResolver for resolving paths
 
     Returns:
@@ -120,8 +83,7 @@ def _is_eligible(
         return False, f"status={row.get('status')}_not_in_filter"
 
     # Check job_id filter
-    job_id = row.get("job_id", "")
-    if jobs_filter and not _job_matches_filter(job_id, jobs_filter):
+    if not job_id_matches:
         return False, "job_id_not_matching_filter"
 
     # Check if already done (unless redo)
@@ -297,7 +259,7 @@ def _process_job(
         # Write result.json (ensure directory exists)
         result_json_path.parent.mkdir(parents=True, exist_ok=True)
         with open(result_json_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+            f.write(json.dumps(payload, indent=2))
 
         # Write detailed alignment log for debugging
         if "alignment_log" in payload and "timing" in payload:
@@ -474,14 +436,20 @@ def compute_fscore(
     eligible_rows = []
     skip_reasons: dict[str, int] = {}
 
-    for _, row in df.iterrows():
+    # Job-id filter evaluated over the whole column with one compiled regex
+    if jobs:
+        job_id_ok = df["job_id"].astype(str).str.contains(job_filter_regex(jobs)).tolist()
+    else:
+        job_id_ok = [True] * len(df)
+
+    for (_, row), job_id_matches in zip(df.iterrows(), job_id_ok, strict=True):
         is_eligible, reason = _is_eligible(
             row=row,
             run_id=run_id,
             only_status=status_list,
             with_gt_only=with_gt_only,
             redo=redo,
-            jobs_filter=jobs,
+            job_id_matches=job_id_matches,
             paths=paths,
         )
 
@@ -13,15 +13,18 @@ The adapter normalizes the tool's output into a canonical payload
 schema for persistence and CSV upserts.
 """
 
-import json
-import subprocess
-import time
+# json, shutil, subprocess, time and traceback are imported lazily inside the
+# functions that need them, keeping `import vfscore_adapter` (done by the
+# discovery layer) cheap when the CLI fallback is never used.
+import os
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VFScoreRequest:
     """Input specification for VFScore evaluation."""
 
@@ -34,8 +37,22 @@ class VFScoreRequest:
     blender_exe: Path | None = None
     algo: str | None = None  # Algorithm identifier for artifact naming
 
+    # String forms of the paths, computed once for the import/CLI call sites
+    _cand_glb_s: str = field(init=False, repr=False, compare=False)
+    _ref_images_s: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _out_dir_s: str = field(init=False, repr=False, compare=False)
+    _workspace_s: str | None = field(init=False, repr=False, compare=False)
+    _blender_exe_s: str | None = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        self._cand_glb_s = str(self.cand_glb)
+        self._ref_images_s = tuple(map(str, self.ref_images))
+        self._out_dir_s = str(self.out_dir)
+        self._workspace_s = str(self.workspace) if self.workspace else None
+        self._blender_exe_s = str(self.blender_exe) if self.blender_exe else None
+
+
+@dataclass(slots=True)
 class VFScoreResponse:
     """Normalized VFScore evaluation result."""
 
@@ -48,7 +65,60 @@ class VFScoreResponse:
     error: str | None = None
 
 
-def _normalize_payload(raw: dict[str, Any]) -> dict[str, Any]:
+# CLI stderr is written to <out_dir>/vfscore.stderr.log; only its tail is
+# kept in the error message on failure
+_STDERR_LOG_NAME = "vfscore.stderr.log"
+_STDERR_TAIL_BYTES = 2048
+
+# Canonical payload schema, in output order
+_CANONICAL_KEYS: tuple[str, ...] = (
+    # Core metrics
+    "vfscore_overall_median",
+    "lpips_distance",
+    "lpips_model",
+    "iou",
+    "mask_error",
+    "pose_confidence",
+    # Score combination parameters
+    "gamma",
+    "pose_compensation_c",
+    # Final pose parameters
+    "azimuth_deg",
+    "elevation_deg",
+    "radius",
+    "fov_deg",
+    "obj_yaw_deg",
+    # Pipeline statistics
+    "pipeline_mode",
+    "num_step2_candidates",
+    "num_step4_candidates",
+    "num_selected_candidates",
+    "best_lpips_idx",
+    # Artifact paths (workspace-relative)
+    "artifacts_dir",
+    "gt_image_path",
+    "render_image_path",
+    # DEPRECATED fields (kept for backward compatibility)
+    "vf_subscores_median",
+    "repeats_n",
+    "scores_all",
+    "subscores_all",
+    "iqr",
+    "std",
+    "llm_model",
+    "rubric_weights",
+    "render_settings",
+)
+
+# Fields returned alongside the payload rather than inside it
+_SIBLING_KEYS = frozenset(
+    {"version", "config_hash", "render_runtime_s", "scoring_runtime_s"}
+)
+
+
+def _normalize_payload(
+    raw: dict[str, Any],
+) -> tuple[dict[str, Any], str | None, str | None, float | None, float | None]:
     """
     Normalize VFScore tool output into canonical payload schema.
 
@@ -63,66 +133,83 @@ def _normalize_payload(raw: dict[str, Any]) -> dict[str, Any]:
     - vf_subscores_median, repeats_n, scores_all, subscores_all, iqr, std
     - llm_model, rubric_weights, render_settings
 
-    Missing fields are filled with None.
+    Missing fields are filled with None. The sibling fields consumed by the
+    callers are collected in the same pass over ``raw``. A payload that
+    already has exactly the canonical keys, in order (e.g. a result.json
+    written from a normalized payload), is returned as-is: normalizing it
+    would produce an equal dict, and it has no sibling fields.
+
+    Returns:
+        Tuple of (payload, version, config_hash, render_runtime_s, scoring_runtime_s)
     """
-    normalized = {
-        # Core metrics
-        "vfscore_overall_median": raw.get("vfscore_overall_median"),
-        "lpips_distance": raw.get("lpips_distance"),
-        "lpips_model": raw.get("lpips_model"),
-        "iou": raw.get("iou"),
-        "mask_error": raw.get("mask_error"),
-        "pose_confidence": raw.get("pose_confidence"),
-
-        # Score combination parameters
-        "gamma": raw.get("gamma"),
-        "pose_compensation_c": raw.get("pose_compensation_c"),
-
-        # Final pose parameters
-        "azimuth_deg": raw.get("azimuth_deg"),
-        "elevation_deg": raw.get("elevation_deg"),
-        "radius": raw.get("radius"),
-        "fov_deg": raw.get("fov_deg"),
-        "obj_yaw_deg": raw.get("obj_yaw_deg"),
-
-        # Pipeline statistics
-        "pipeline_mode": raw.get("pipeline_mode"),
-        "num_step2_candidates": raw.get("num_step2_candidates"),
-        "num_step4_candidates": raw.get("num_step4_candidates"),
-        "num_selected_candidates": raw.get("num_selected_candidates"),
-        "best_lpips_idx": raw.get("best_lpips_idx"),
-
-        # Artifact paths (workspace-relative)
-        "artifacts_dir": raw.get("artifacts_dir"),
-        "gt_image_path": raw.get("gt_image_path"),
-        "render_image_path": raw.get("render_image_path"),
-
-        # DEPRECATED fields (kept for backward compatibility)
-        "vf_subscores_median": raw.get("vf_subscores_median", {
-            "finish": None,
-            "texture_identity": None,
-            "texture_scale_placement": None,
-        }),
-        "repeats_n": raw.get("repeats_n"),
-        "scores_all": raw.get("scores_all", []),
-        "subscores_all": raw.get("subscores_all", []),
-        "iqr": raw.get("iqr"),
-        "std": raw.get("std"),
-        "llm_model": raw.get("llm_model"),
-        "rubric_weights": raw.get("rubric_weights", {
-            "finish": None,
-            "texture_identity": None,
-            "texture_scale_placement": None,
-        }),
-        "render_settings": raw.get("render_settings", {
-            "engine": "pyrender",
-            "hdri": None,
-            "camera": None,
-            "seed": None,
-        }),
+    # Fast path: already in canonical form (same keys, same order)
+    if len(raw) == len(_CANONICAL_KEYS) and tuple(raw) == _CANONICAL_KEYS:
+        return raw, None, None, None, None
+
+    # Scalar fields default to None (C-level fill); mutable defaults are fresh per call
+    normalized: dict[str, Any] = dict.fromkeys(_CANONICAL_KEYS)
+    normalized["vf_subscores_median"] = {
+        "finish": None,
+        "texture_identity": None,
+        "texture_scale_placement": None,
+    }
+    normalized["scores_all"] = []
+    normalized["subscores_all"] = []
+    normalized["rubric_weights"] = {
+        "finish": None,
+        "texture_identity": None,
+        "texture_scale_placement": None,
     }
+    normalized["render_settings"] = {
+        "engine": "pyrender",
+        "hdri": None,
+        "camera": None,
+        "seed": None,
+    }
+    siblings: dict[str, Any] = {}
+
+    # Single pass: project canonical keys and pick up sibling fields
+    for key, value in raw.items():
+        if key in normalized:
+            normalized[key] = value
+        elif key in _SIBLING_KEYS:
+            siblings[key] = value
 
-    return normalized
+    return (
+        normalized,
+        siblings.get("version"),
+        siblings.get("config_hash"),
+        siblings.get("render_runtime_s"),
+        siblings.get("scoring_runtime_s"),
+    )
+
+
+def _filter_existing_refs(ref_images: list[Path]) -> list[Path]:
+    """
+    Return the reference images that exist on disk, preserving order.
+
+    References usually share a handful of parent directories, so each parent
+    is listed once with os.scandir instead of stat-ing every image. Names
+    missing from a listing (or parents that cannot be listed) fall back to
+    Path.exists(), which keeps case-insensitive filesystems correct.
+    """
+    listings: dict[Path, set[str] | None] = {}
+    existing: list[Path] = []
+
+    for p in ref_images:
+        parent = p.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as it:
+                    listings[parent] = {entry.name for entry in it}
+            except OSError:
+                listings[parent] = None
+
+        names = listings[parent]
+        if (names is not None and p.name in names) or p.exists():
+            existing.append(p)
+
+    return existing
 
 
 def _try_import_api(req: VFScoreRequest) -> VFScoreResponse | None:
@@ -136,28 +223,28 @@ def _try_import_api(req: VFScoreRequest) -> VFScoreResponse | None:
         # This is a placeholder for the actual import path
         # Expected interface:
         # evaluate_visual_fidelity(cand_glb, ref_images, out_dir, repeats, timeout_s)
+        import time  # noqa: PLC0415
+
         from vfscore.evaluator import evaluate_visual_fidelity  # type: ignore  # noqa: PLC0415
 
         start_total = time.perf_counter()
         result = evaluate_visual_fidelity(
-            cand_glb=str(req.cand_glb),
-            ref_images=[str(p) for p in req.ref_images],
-            out_dir=str(req.out_dir),
+            cand_glb=req._cand_glb_s,
+            ref_images=list(req._ref_images_s),
+            out_dir=req._out_dir_s,
             repeats=req.repeats,
             timeout_s=req.timeout_s,
-            workspace=str(req.workspace) if req.workspace else None,
-            blender_exe=str(req.blender_exe) if req.blender_exe else None,
+            workspace=req._workspace_s,
+            blender_exe=req._blender_exe_s,
             quiet=False,  # Quiet mode disabled: QuietModeFilter has Cython compilation issues with stdout redirection
             algo=req.algo,  # Pass algorithm identifier for artifact naming
         )
         total_runtime = time.perf_counter() - start_total
 
-        # Normalize result
-        payload = _normalize_payload(result)
-
-        # Extract render and scoring runtimes if available
-        render_runtime = result.get("render_runtime_s")
-        scoring_runtime = result.get("scoring_runtime_s")
+        # Normalize result (also extracts version, config hash, and runtimes)
+        payload, tool_version, config_hash, render_runtime, scoring_runtime = (
+            _normalize_payload(result)
+        )
 
         # If not provided separately, estimate from total
         if render_runtime is None and scoring_runtime is None:
@@ -168,8 +255,8 @@ def _try_import_api(req: VFScoreRequest) -> VFScoreResponse | None:
         return VFScoreResponse(
             ok=True,
             payload=payload,
-            tool_version=result.get("version"),
-            config_hash=result.get("config_hash"),
+            tool_version=tool_version,
+            config_hash=config_hash,
             render_runtime_s=render_runtime,
             scoring_runtime_s=scoring_runtime,
         )
@@ -178,7 +265,8 @@ def _try_import_api(req: VFScoreRequest) -> VFScoreResponse | None:
         return None  # Import failed, will try CLI fallback
     except Exception as e:
         # Include exception type and full traceback for debugging
-        import traceback
+        import traceback  # noqa: PLC0415
+
         tb_str = traceback.format_exc()
         return VFScoreResponse(
             ok=False,
@@ -186,44 +274,78 @@ def _try_import_api(req: VFScoreRequest) -> VFScoreResponse | None:
         )
 
 
+def _read_log_tail(path: Path, n_bytes: int) -> str:
+    """Return the last ``n_bytes`` of a log file decoded as UTF-8 ("" if unreadable)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - n_bytes, 0))
+            return f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def _vfscore_cli_prefix() -> tuple[str, ...]:
+    """
+    Resolve the command prefix used to launch the VFScore CLI (cached).
+
+    Prefers the installed ``vfscore`` console script; otherwise runs the
+    package with the current interpreter (``sys.executable -m vfscore``)
+    rather than whichever ``python`` happens to be first on PATH.
+    """
+    import shutil  # noqa: PLC0415
+
+    exe = shutil.which("vfscore")
+    return (exe,) if exe else (sys.executable, "-m", "vfscore")
+
+
 def _try_cli_invocation(req: VFScoreRequest) -> VFScoreResponse:
     """
     Fallback: invoke VFScore via CLI.
 
     Expected CLI interface:
-    python -m vfscore --cand-glb <path> --ref-images <path1> <path2> ...
-                      --out-dir <dir> --repeats <n>
+    vfscore --cand-glb <path> --ref-images <path1> <path2> ...
+            --out-dir <dir> --repeats <n>
+    (or ``<sys.executable> -m vfscore ...`` when no console script is installed)
 
     Returns VFScoreResponse with ok=True on success, ok=False on error.
     """
+    import json  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+    import time  # noqa: PLC0415
+
     try:
         cmd = [
-            "python",
-            "-m",
-            "vfscore",
+            *_vfscore_cli_prefix(),
             "--cand-glb",
-            str(req.cand_glb),
+            req._cand_glb_s,
             "--ref-images",
         ]
 
         # Add all reference image paths
-        cmd.extend([str(p) for p in req.ref_images])
+        cmd.extend(req._ref_images_s)
 
         cmd.extend([
             "--out-dir",
-            str(req.out_dir),
+            req._out_dir_s,
             "--repeats",
             str(req.repeats),
         ])
 
+        # stderr (Blender diagnostics) goes to a log file instead of a pipe;
+        # truncated per invocation so a failure reports only this run's output
+        stderr_log = req.out_dir / _STDERR_LOG_NAME
+
         start = time.perf_counter()
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=req.timeout_s,
-            check=True,
-        )
+        with open(stderr_log, "wb") as stderr_f:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_f,
+                timeout=req.timeout_s,
+                check=True,
+            )
         total_runtime = time.perf_counter() - start
 
         # Try to parse result from result.json in out_dir
@@ -232,14 +354,12 @@ def _try_cli_invocation(req: VFScoreRequest) -> VFScoreResponse:
             with open(result_path, encoding="utf-8") as f:
                 raw = json.load(f)
         else:
-            # Try parsing stdout as JSON
+            # Try parsing stdout as JSON (json accepts UTF-8 bytes directly)
             raw = json.loads(result.stdout)
 
-        payload = _normalize_payload(raw)
-
-        # Extract runtimes
-        render_runtime = raw.get("render_runtime_s")
-        scoring_runtime = raw.get("scoring_runtime_s")
+        payload, tool_version, config_hash, render_runtime, scoring_runtime = (
+            _normalize_payload(raw)
+        )
 
         if render_runtime is None and scoring_runtime is None:
             render_runtime = total_runtime * 0.6
@@ -248,8 +368,8 @@ def _try_cli_invocation(req: VFScoreRequest) -> VFScoreResponse:
         return VFScoreResponse(
             ok=True,
             payload=payload,
-            tool_version=raw.get("version"),
-            config_hash=raw.get("config_hash"),
+            tool_version=tool_version,
+            config_hash=config_hash,
             render_runtime_s=render_runtime,
             scoring_runtime_s=scoring_runtime,
         )
@@ -257,9 +377,11 @@ def _try_cli_invocation(req: VFScoreRequest) -> VFScoreResponse:
     except subprocess.TimeoutExpired:
         return VFScoreResponse(ok=False, error="VFScore timeout")
     except subprocess.CalledProcessError as e:
+        # Decode only the tail of the stderr log; Blender logs can be large
+        err_tail = _read_log_tail(req.out_dir / _STDERR_LOG_NAME, _STDERR_TAIL_BYTES)
         return VFScoreResponse(
             ok=False,
-            error=f"VFScore failed (exit {e.returncode}): {e.stderr[:150]}",
+            error=f"VFScore failed (exit {e.returncode}): {err_tail}",
         )
     except Exception as e:
         return VFScoreResponse(
@@ -284,7 +406,9 @@ def evaluate_vfscore(req: VFScoreRequest) -> VFScoreResponse:
     req.out_dir.mkdir(parents=True, exist_ok=True)
 
     # Validate inputs
-    if not req.cand_glb.exists():
+    try:
+        os.stat(req._cand_glb_s)
+    except OSError:
         return VFScoreResponse(
             ok=False,
             error=f"Candidate GLB not found: {req.cand_glb}",
@@ -297,15 +421,17 @@ def evaluate_vfscore(req: VFScoreRequest) -> VFScoreResponse:
         )
 
     # Check that at least one reference image exists
-    existing_refs = [p for p in req.ref_images if p.exists()]
+    existing_refs = _filter_existing_refs(req.ref_images)
     if not existing_refs:
         return VFScoreResponse(
             ok=False,
             error="No reference images found on disk",
         )
 
-    # Update request to only use existing images
-    req.ref_images = existing_refs
+    # Update request to only use existing images (keep cached strings in sync)
+    if len(existing_refs) != len(req.ref_images):
+        req.ref_images = existing_refs
+        req._ref_images_s = tuple(map(str, existing_refs))
 
     # Discover and invoke adapter
     try:
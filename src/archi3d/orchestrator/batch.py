@@ -11,50 +11,173 @@ and per-run manifests in runs/<run_id>/manifest.csv.
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from pathlib import Path
 
 import pandas as pd
 
 from archi3d.config.adapters_cfg import get_adapter_image_mode
 from archi3d.config.paths import PathResolver
-from archi3d.db.generations import compute_image_set_hash, compute_job_id, upsert_generations
-from archi3d.utils.io import append_log_record
+from archi3d.db.generations import compute_image_set_hashes, compute_job_ids, upsert_generations
+from archi3d.utils.io import (
+    append_log_record,
+    read_csv_arrow,
+    stat_or_none,
+    write_csv_arrow,
+)
+
+# items.csv columns carried over to every generation record (stripped strings)
+ITEM_TEXT_COLS = [
+    "product_id",
+    "variant",
+    "manufacturer",
+    "product_name",
+    "category_l1",
+    "category_l2",
+    "category_l3",
+    "description",
+    "gt_object_path",
+]
+IMAGE_COLS = [f"image_{i}_path" for i in range(1, 7)]
+
+# Catalog columns read by batch creation (everything else is never loaded)
+ITEM_COLS = [*ITEM_TEXT_COLS, "n_images", *IMAGE_COLS]
+
+# Column order of the generation records written to tables/generations.csv
+GENERATION_COLS = [
+    # Carry-over from parent (observability)
+    "product_id",
+    "variant",
+    "manufacturer",
+    "product_name",
+    "category_l1",
+    "category_l2",
+    "category_l3",
+    "description",
+    "source_n_images",
+    *[f"source_image_{i}_path" for i in range(1, 7)],
+    "gt_object_path",
+    # Batch/job metadata
+    "run_id",
+    "job_id",
+    "algo",
+    "algo_version",
+    "used_n_images",
+    *[f"used_image_{i}_path" for i in range(1, 7)],
+    "image_set_hash",
+    "status",
+    "created_at",
+    "notes",
+]
+
+# Columns of runs/<run_id>/manifest.csv
+MANIFEST_COLS = [
+    "job_id", "product_id", "variant", "algo", "used_n_images",
+    "used_image_1_path", "used_image_2_path", "used_image_3_path",
+    "used_image_4_path", "used_image_5_path", "used_image_6_path",
+    "image_set_hash",
+    # Optional convenience columns
+    "gt_object_path", "product_name", "manufacturer",
+]
+
+MANIFEST_FORMATS = ("csv", "parquet")
+
+# Text columns of generations.csv read back as strings (keys + manifest fields)
+_GENERATIONS_STR_COLS = [
+    "run_id", "status", *(c for c in MANIFEST_COLS if c != "used_n_images")
+]
+
+# -------------------------------
+# Catalog Loading
+# -------------------------------
+
+def _load_items(items_csv_path: Path, items_parquet_path: Path) -> pd.DataFrame:
+    """
+    Load the items catalog, preferring tables/items.parquet over items.csv.
+
+    The parquet copy is used only when it is at least as recent as items.csv,
+    so a hand-edited CSV is never shadowed by a stale build. Only ITEM_COLS
+    are deserialized from it. Missing values become "" from either source,
+    so both give the same frame.
+
+    Raises:
+        FileNotFoundError: If neither items.csv nor items.parquet exists.
+    """
+    parquet_stat = stat_or_none(items_parquet_path)
+    csv_stat = stat_or_none(items_csv_path)
+    if parquet_stat is not None and (
+        csv_stat is None or parquet_stat.st_mtime_ns >= csv_stat.st_mtime_ns
+    ):
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        present = set(pq.read_schema(items_parquet_path).names)
+        return pd.read_parquet(
+            items_parquet_path,
+            engine="pyarrow",
+            columns=[c for c in ITEM_COLS if c in present],
+        ).fillna("")
+
+    if csv_stat is None:
+        raise FileNotFoundError(
+            f"items.csv not found at {items_csv_path}.\n"
+            "Run 'archi3d catalog build' first."
+        )
+    return read_csv_arrow(items_csv_path, str_cols=("product_id", "variant")).fillna("")
+
 
 # -------------------------------
 # Image Selection Policy
 # -------------------------------
 
-def _select_images_use_up_to_6(row: pd.Series) -> tuple[list[str], str]:
+def _select_images_use_up_to_6(
+    n_images: pd.Series,
+    image_lists: list[list[str]],
+) -> tuple[list[list[str]], pd.Series]:
     """
-    Apply 'use_up_to_6' image selection policy.
+    Apply 'use_up_to_6' image selection policy to all items at once.
 
     Uses the first n_images from items.csv (already ordered by Phase 1).
     Phase 1 guarantees deterministic selection and max 6 images.
 
     Args:
-        row: DataFrame row from items.csv with image_1_path...image_6_path columns.
+        n_images: n_images column from items.csv.
+        image_lists: Per-item ordered lists of non-empty image paths
+                     (from image_1_path...image_6_path).
 
     Returns:
-        (selected_image_paths, skip_reason)
-        skip_reason is "no_images" if n_images < 1, else ""
+        (selected_image_lists, has_images)
+        has_images is False for items with n_images < 1 (skip reason "no_images").
+    """
+    has_images = n_images >= 1
+
+    # Selection is the non-empty paths in order; it should match n_images
+    # from Phase 1, but we continue with what we found if it does not.
+    selected = [imgs if keep else [] for imgs, keep in zip(image_lists, has_images, strict=True)]
+
+    return selected, has_images
+
+
+def _collect_image_lists(items_df: pd.DataFrame) -> list[list[str]]:
     """
-    n_images = int(row.get("n_images", 0))
+    Collect the ordered, non-empty image paths of every item.
 
-    if n_images < 1:
-        return [], "no_images"
+    Args:
+        items_df: DataFrame from items.csv with image_1_path...image_6_path columns.
 
-    # Collect non-empty image paths in order
-    selected = []
-    for i in range(1, 7):  # image_1_path through image_6_path
-        path = str(row.get(f"image_{i}_path", "")).strip()
-        if path:
-            selected.append(path)
+    Returns:
+        One list of stripped, non-empty paths per row.
+    """
+    image_matrix = (
+        items_df.reindex(columns=IMAGE_COLS, fill_value="")
+        .astype(str)
+        .apply(lambda col: col.str.strip())
+        .to_numpy()
+    )
+    return [[p for p in row if p] for row in image_matrix]
 
-    # Should match n_images from Phase 1, but verify
-    if len(selected) != n_images:
-        # Log warning but continue with what we found
-        pass
 
-    return selected, ""
+def _image_path_columns(image_lists: list[list[str]]) -> list[list[str]]:
+    """Transpose per-row image lists into six *_path columns padded with ""."""
+    return [[imgs[k] if k < len(imgs) else "" for imgs in image_lists] for k in range(6)]
 
 
 # -------------------------------
@@ -97,6 +220,18 @@ def _select_algos_for_item(
 # Filtering
 # -------------------------------
 
+def _lower_by_unique(col: pd.Series) -> list[str]:
+    """
+    Lowercase a string column, doing the work once per distinct value.
+
+    Catalog columns such as variant and product_name repeat heavily, so
+    factorizing first keeps the lowercasing O(n_unique).
+    """
+    codes, uniques = pd.factorize(col.astype(str))
+    lowered = [u.lower() for u in uniques]
+    return [lowered[c] for c in codes]
+
+
 def _apply_filters(
     items_df: pd.DataFrame,
     include: str | None = None,
@@ -111,47 +246,58 @@ def _apply_filters(
         (filtered_df, skip_counts) where skip_counts has keys like 'filtered_include', 'filtered_exclude', etc.
     """
     skip_counts: dict[str, int] = {}
-    df = items_df.copy()
-    initial_count = len(df)
+    df = items_df
+    # Single keep-mask, narrowed by each filter and applied once at the end
+    keep = [True] * len(df)
+
+    # Lowercased search text over product_id/variant/product_name, built once
+    # and shared by include and exclude. The NUL separator keeps a pattern from
+    # matching across field boundaries.
+    if include or exclude:
+        blob = [
+            "\x00".join(fields)
+            for fields in zip(
+                _lower_by_unique(df["product_id"]),
+                _lower_by_unique(df["variant"]),
+                _lower_by_unique(df["product_name"]),
+                strict=True,
+            )
+        ]
 
     # 1. Include filter (match on product_id, variant, or product_name)
     if include:
         pattern = include.lower()
-        mask = (
-            df["product_id"].str.lower().str.contains(pattern, na=False, regex=False) |
-            df["variant"].str.lower().str.contains(pattern, na=False, regex=False) |
-            df["product_name"].str.lower().str.contains(pattern, na=False, regex=False)
-        )
-        excluded = int(initial_count - mask.sum())
+        keep = [k and pattern in text for k, text in zip(keep, blob, strict=True)]
+        excluded = len(keep) - sum(keep)
         if excluded > 0:
             skip_counts["filtered_include"] = excluded
-        df = df[mask].reset_index(drop=True)
 
     # 2. Exclude filter
     if exclude:
         pattern = exclude.lower()
-        mask = ~(
-            df["product_id"].str.lower().str.contains(pattern, na=False, regex=False) |
-            df["variant"].str.lower().str.contains(pattern, na=False, regex=False) |
-            df["product_name"].str.lower().str.contains(pattern, na=False, regex=False)
-        )
-        excluded = int(len(df) - mask.sum())
+        before = sum(keep)
+        keep = [k and pattern not in text for k, text in zip(keep, blob, strict=True)]
+        excluded = before - sum(keep)
         if excluded > 0:
             skip_counts["filtered_exclude"] = excluded
-        df = df[mask].reset_index(drop=True)
 
     # 3. with-gt-only
     if with_gt_only:
-        mask = df["gt_object_path"].str.strip().str.len() > 0
-        excluded = int(len(df) - mask.sum())
+        has_gt = (df["gt_object_path"].str.strip().str.len() > 0).tolist()
+        before = sum(keep)
+        keep = [k and g for k, g in zip(keep, has_gt, strict=True)]
+        excluded = before - sum(keep)
         if excluded > 0:
             skip_counts["with_gt_only"] = excluded
-        df = df[mask].reset_index(drop=True)
+
+    if not all(keep):
+        df = df[keep]
 
     # 4. Limit (apply last)
     if limit is not None and limit > 0 and len(df) > limit:
-        df = df.head(limit).reset_index(drop=True)
+        df = df.head(limit)
 
+    df = df.reset_index(drop=True)
     return df, skip_counts
 
 
@@ -170,11 +316,12 @@ def create_batch(
     with_gt_only: bool = False,
     dry_run: bool = False,
     algo_by_images: bool = False,
+    manifest_format: str = "csv",
 ) -> dict:
     """
     Create a batch of jobs for the given run_id and algorithms.
 
-    Reads tables/items.csv, applies filters and image selection policy,
+    Reads tables/items.csv (or its items.parquet copy), applies filters and image selection policy,
     upserts rows to tables/generations.csv with status='enqueued',
     and creates runs/<run_id>/manifest.csv.
 
@@ -191,13 +338,17 @@ def create_batch(
         algo_by_images: If True (ecotest mode), select algorithms based on n_images:
                         single-image algos for items with 1 image,
                         multi-image algos for items with 2+ images.
+        manifest_format: "csv" (default) or "parquet". With "parquet",
+                         runs/<run_id>/manifest.parquet is written next to
+                         manifest.csv (kept for inspection) and preferred by
+                         the worker.
 
     Returns:
         Summary dict with counts and skip reasons.
 
     Raises:
         FileNotFoundError: If tables/items.csv doesn't exist.
-        ValueError: If image_policy is not supported.
+        ValueError: If image_policy or manifest_format is not supported.
     """
     # Validate workspace
     paths.ensure_mutable_tree()
@@ -205,20 +356,18 @@ def create_batch(
     # Validate policy
     if image_policy != "use_up_to_6":
         raise ValueError(f"Unsupported image policy: {image_policy}")
+    if manifest_format not in MANIFEST_FORMATS:
+        raise ValueError(f"Unsupported manifest format: {manifest_format}")
 
-    # Read items.csv
+    # Resolve all paths once. manifest_path is built from runs_dir rather than
+    # paths.run_root(), which would create the run directory even on dry runs.
     items_csv_path = paths.items_csv_path()
-    if not items_csv_path.exists():
-        raise FileNotFoundError(
-            f"items.csv not found at {items_csv_path}.\n"
-            "Run 'archi3d catalog build' first."
-        )
+    generations_csv_path = paths.generations_csv_path()
+    log_path = paths.batch_create_log_path()
+    manifest_path = paths.runs_dir / run_id / "manifest.csv"
 
-    items_df = pd.read_csv(
-        items_csv_path,
-        dtype={"product_id": str, "variant": str},
-        encoding="utf-8-sig",
-    ).fillna("")
+    # Read the items catalog
+    items_df = _load_items(items_csv_path, paths.items_parquet_path())
 
     # Apply filters
     filtered_df, filter_skip_counts = _apply_filters(
@@ -232,134 +381,120 @@ def create_batch(
     candidates = int(len(filtered_df))
 
     # Build generation records
-    generation_records = []
     skip_reasons: dict[str, int] = {}
 
-    # Load existing jobs to avoid overwriting (preserves status of completed/failed jobs)
-    existing_job_keys: set[tuple[str, str]] = set()
-    generations_csv_path = paths.generations_csv_path()
-    if generations_csv_path.exists():
-        existing_df = pd.read_csv(
-            generations_csv_path,
-            dtype={"product_id": str, "variant": str, "run_id": str, "job_id": str},
-            encoding="utf-8-sig",
-            usecols=["run_id", "job_id"],
-        )
-        existing_job_keys = set(
-            zip(
-                existing_df["run_id"].astype(str),
-                existing_df["job_id"].astype(str),
-                strict=True,
-            )
-        )
+    # Load existing jobs to avoid overwriting (preserves status of completed/failed jobs).
+    # Rows of this run that are still enqueued are kept for the manifest, so
+    # generations.csv is parsed once instead of again after the upsert.
+    existing_job_ids: set[str] = set()
+    prior_enqueued = pd.DataFrame(columns=MANIFEST_COLS)
+    generations_existed = generations_csv_path.exists()
+    # Nothing survived the filters: no job can exist or be enqueued, so skip
+    # parsing the (possibly large) generations table entirely
+    if generations_existed and candidates:
+        existing_df = read_csv_arrow(generations_csv_path, str_cols=_GENERATIONS_STR_COLS)
+        # Only this run's keys can collide; both columns are already read as
+        # strings, so the job ids go into the set without conversion copies
+        in_run = (existing_df["run_id"] == run_id).to_numpy()
+        existing_job_ids = set(existing_df["job_id"].to_numpy()[in_run])
+        prior_enqueued = existing_df[
+            in_run & (existing_df["status"] == "enqueued").to_numpy()
+        ].reindex(columns=MANIFEST_COLS, fill_value="")
 
     # Partition algorithms by image mode for ecotest
     single_algos = [a for a in algos if get_adapter_image_mode(a) == "single"]
     multi_algos = [a for a in algos if get_adapter_image_mode(a) == "multi"]
 
-    for _, row in filtered_df.iterrows():
-        # Extract parent fields
-        product_id = str(row["product_id"]).strip()
-        variant = str(row["variant"]).strip()
-        manufacturer = str(row["manufacturer"]).strip()
-        product_name = str(row["product_name"]).strip()
-        category_l1 = str(row["category_l1"]).strip()
-        category_l2 = str(row["category_l2"]).strip()
-        category_l3 = str(row["category_l3"]).strip()
-        description = str(row["description"]).strip()
-        source_n_images = int(row["n_images"])
-        gt_object_path = str(row["gt_object_path"]).strip()
-
-        # Collect source images
-        source_images = []
-        for i in range(1, 7):
-            path = str(row.get(f"image_{i}_path", "")).strip()
-            if path:
-                source_images.append(path)
-
-        # Apply image selection policy
-        used_images, skip_reason = _select_images_use_up_to_6(row)
-
-        if skip_reason:
-            skip_reasons[skip_reason] = skip_reasons.get(skip_reason, 0) + 1
-            continue
-
-        # Compute common fields
-        image_set_hash = compute_image_set_hash(used_images)
-        used_images_padded = used_images + [""] * (6 - len(used_images))
-        source_images_padded = source_images + [""] * (6 - len(source_images))
-
-        # Select algorithms for this item based on ecotest mode
-        item_algos = _select_algos_for_item(
-            n_images=source_n_images,
+    # Column-wise extraction of item fields (no per-row DataFrame access)
+    item_text = (
+        filtered_df.reindex(columns=ITEM_TEXT_COLS, fill_value="")
+        .astype(str)
+        .apply(lambda col: col.str.strip())
+        .reset_index(drop=True)
+    )
+    source_n_images = filtered_df["n_images"].astype(int).reset_index(drop=True)
+    source_images = _collect_image_lists(filtered_df)
+
+    # Apply image selection policy
+    used_images, has_images = _select_images_use_up_to_6(source_n_images, source_images)
+    n_no_images = int((~has_images).sum())
+    if n_no_images:
+        skip_reasons["no_images"] = n_no_images
+
+    # Select algorithms for each item based on ecotest mode. The choice only
+    # depends on the image count, so resolve it once per distinct count.
+    algos_by_n = {
+        n: _select_algos_for_item(
+            n_images=n,
             single_algos=single_algos,
             multi_algos=multi_algos,
             algo_by_images=algo_by_images,
         )
+        for n in set(source_n_images[has_images])
+    }
+    item_algos = [
+        algos_by_n[n] if keep else []
+        for n, keep in zip(source_n_images, has_images, strict=True)
+    ]
+    n_no_algo = sum(1 for keep, a in zip(has_images, item_algos, strict=True) if keep and not a)
+    if n_no_algo:
+        skip_reasons["no_matching_algo"] = n_no_algo
+
+    # Per-item columns of the generation records, built once per item
+    item_columns: dict[str, object] = {c: item_text[c] for c in ITEM_TEXT_COLS}
+    item_columns["source_n_images"] = source_n_images
+    for k, (source_col, used_col) in enumerate(
+        zip(_image_path_columns(source_images), _image_path_columns(used_images), strict=True),
+        start=1,
+    ):
+        item_columns[f"source_image_{k}_path"] = source_col
+        item_columns[f"used_image_{k}_path"] = used_col
+    item_columns["used_n_images"] = [len(u) for u in used_images]
+    item_columns["image_set_hash"] = compute_image_set_hashes(used_images)
+    item_frame = pd.DataFrame(item_columns, index=pd.RangeIndex(len(item_text)))
+
+    # Expand (item x algo) into jobs: explode the per-item algorithm lists
+    # (items without algos drop out) and gather every item column into job
+    # order with a single positional take()
+    job_algos = pd.Series(item_algos, dtype=object).explode().dropna()
+    jobs = item_frame.take(job_algos.index.to_numpy(dtype="int64"))
+    jobs["algo"] = job_algos.to_numpy()
+    jobs = jobs.reset_index(drop=True)
+
+    job_ids = compute_job_ids(
+        jobs["product_id"], jobs["variant"], jobs["algo"], jobs["image_set_hash"]
+    )
 
-        if not item_algos:
-            skip_reasons["no_matching_algo"] = (
-                skip_reasons.get("no_matching_algo", 0) + 1
-            )
-            continue
-
-        for algo in item_algos:
-            job_id = compute_job_id(product_id, variant, algo, image_set_hash)
-
-            # Skip if job already exists (preserves status of completed/failed jobs)
-            if (run_id, job_id) in existing_job_keys:
-                skip_reasons["already_exists"] = skip_reasons.get("already_exists", 0) + 1
-                continue
-
-            # Create generation record
-            record = {
-                # Carry-over from parent (observability)
-                "product_id": product_id,
-                "variant": variant,
-                "manufacturer": manufacturer,
-                "product_name": product_name,
-                "category_l1": category_l1,
-                "category_l2": category_l2,
-                "category_l3": category_l3,
-                "description": description,
-                "source_n_images": source_n_images,
-                "source_image_1_path": source_images_padded[0],
-                "source_image_2_path": source_images_padded[1],
-                "source_image_3_path": source_images_padded[2],
-                "source_image_4_path": source_images_padded[3],
-                "source_image_5_path": source_images_padded[4],
-                "source_image_6_path": source_images_padded[5],
-                "gt_object_path": gt_object_path,
-                # Batch/job metadata
-                "run_id": run_id,
-                "job_id": job_id,
-                "algo": algo,
-                "algo_version": "",  # Reserved for adapters to fill later
-                "used_n_images": len(used_images),
-                "used_image_1_path": used_images_padded[0],
-                "used_image_2_path": used_images_padded[1],
-                "used_image_3_path": used_images_padded[2],
-                "used_image_4_path": used_images_padded[3],
-                "used_image_5_path": used_images_padded[4],
-                "used_image_6_path": used_images_padded[5],
-                "image_set_hash": image_set_hash,
-                "status": "enqueued",
-                "created_at": datetime.now(UTC).isoformat(),
-                "notes": "",
-            }
-
-            generation_records.append(record)
+    # Skip jobs that already exist (preserves status of completed/failed jobs)
+    keep = [job_id not in existing_job_ids for job_id in job_ids]
+    n_exists = len(keep) - sum(keep)
+    if n_exists:
+        skip_reasons["already_exists"] = n_exists
+        jobs = jobs[keep].reset_index(drop=True)
+        job_ids = [j for j, k in zip(job_ids, keep, strict=True) if k]
+
+    # Add the batch/job metadata; constants are broadcast. The one clock read
+    # for created_at also stamps the summary below.
+    created_at = datetime.now(UTC).isoformat()
+    generations_df = jobs.assign(
+        run_id=run_id,
+        job_id=job_ids,
+        algo_version="",  # Reserved for adapters to fill later
+        status="enqueued",
+        created_at=created_at,
+        notes="",
+    )[GENERATION_COLS]
 
     # Combine filter skip counts with policy skip counts
     all_skip_reasons = {**filter_skip_counts, **skip_reasons}
 
-    enqueued = len(generation_records)
+    enqueued = len(generations_df)
     skipped = sum(all_skip_reasons.values())
 
     # Build summary
     summary = {
         "event": "batch_create",
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": created_at,
         "run_id": run_id,
         "algos": algos,
         "algo_by_images": algo_by_images,
@@ -375,56 +510,38 @@ def create_batch(
 
     if dry_run:
         # Log summary with dry_run flag but don't write files
-        log_path = paths.batch_create_log_path()
         append_log_record(log_path, summary)
         return summary
 
     # Write to generations.csv (atomic insert - no updates since we skip existing)
-    if generation_records:
-        generations_df = pd.DataFrame(generation_records)
-        generations_csv_path = paths.generations_csv_path()
+    if enqueued:
         inserted, updated = upsert_generations(generations_csv_path, generations_df)
         # Note: updated should always be 0 since we skip existing jobs above
 
-    # Write per-run manifest (derived from generations.csv)
-    if generation_records:
-        # Read back the just-upserted rows for this run_id with status=enqueued
-        generations_csv_path = paths.generations_csv_path()
-        if generations_csv_path.exists():
-            full_gen_df = pd.read_csv(
-                generations_csv_path,
-                dtype={"product_id": str, "variant": str, "run_id": str, "job_id": str},
-                encoding="utf-8-sig",
+    # Write per-run manifest: this run's enqueued rows of generations.csv,
+    # i.e. those already present plus the ones just inserted
+    if enqueued:
+        manifest_df = pd.concat(
+            [prior_enqueued, generations_df[MANIFEST_COLS]], ignore_index=True
+        )
+        if generations_existed:
+            # Match the (run_id, job_id) order update_csv_atomic's merge leaves
+            manifest_df = manifest_df.sort_values("job_id", kind="stable")
+
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_csv_arrow(manifest_df, manifest_path)
+
+        parquet_path = manifest_path.with_suffix(".parquet")
+        if manifest_format == "parquet":
+            # Low-cardinality columns dictionary-encoded
+            manifest_df.astype({"algo": "category", "manufacturer": "category"}).to_parquet(
+                parquet_path, engine="pyarrow", compression="zstd", index=False
             )
-            run_enqueued = full_gen_df[
-                (full_gen_df["run_id"] == run_id) &
-                (full_gen_df["status"] == "enqueued")
-            ].copy()
-
-            # Build manifest with required columns
-            manifest_cols = [
-                "job_id", "product_id", "variant", "algo", "used_n_images",
-                "used_image_1_path", "used_image_2_path", "used_image_3_path",
-                "used_image_4_path", "used_image_5_path", "used_image_6_path",
-                "image_set_hash",
-                # Optional convenience columns
-                "gt_object_path", "product_name", "manufacturer",
-            ]
-
-            # Ensure all required columns exist (handle empty dataframe)
-            for col in manifest_cols:
-                if col not in run_enqueued.columns:
-                    run_enqueued[col] = ""
-
-            manifest_df = run_enqueued[manifest_cols].copy()
-
-            # Write manifest
-            manifest_path = paths.run_root(run_id) / "manifest.csv"
-            manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            manifest_df.to_csv(manifest_path, index=False, encoding="utf-8-sig")
+        else:
+            # A parquet manifest from an earlier batch would shadow this CSV
+            parquet_path.unlink(missing_ok=True)
 
     # Log summary
-    log_path = paths.batch_create_log_path()
     append_log_record(log_path, summary)
 
     return summary
@@ -15,7 +15,14 @@ This module implements the `archi3d consolidate` command, which:
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
+from collections import ChainMap, Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +30,14 @@ import pandas as pd
 
 from archi3d.config.paths import PathResolver
 from archi3d.db.generations import upsert_generations
-from archi3d.utils.io import append_log_record
+from archi3d.utils.io import (
+    append_log_record,
+    read_json,
+    stat_or_none,
+    write_csv_arrow,
+    write_text_atomic,
+)
+from archi3d.utils.text import format_variant_for_filename
 
 # -------------------------
 # Constants
@@ -31,6 +45,21 @@ from archi3d.utils.io import append_log_record
 
 STALE_HEARTBEAT_SECONDS = 600  # 10 minutes
 STATUS_PRECEDENCE = {"completed": 4, "failed": 3, "running": 2, "enqueued": 1}
+MARKER_STATUSES = ("completed", "failed", "inprogress")
+_MAX_READ_THREADS = 32
+
+# generations.csv read dtypes: ids stay text; the low-cardinality columns
+# consolidate filters on are categorical (integer codes, one copy per value)
+_GENERATIONS_DTYPES = {
+    "product_id": str,
+    "variant": str,
+    "run_id": "category",
+    "status": "category",
+    "algo": "category",
+}
+_MARKER_HEAD_BYTES = 256  # "timestamp: <ISO8601>" first line fits well within
+_STAMP_FILENAME = "consolidate.stamp.json"  # under runs/<run_id>/
+_DURATION_PENDING = object()  # set by _reconcile_row, resolved by _fill_durations
 
 
 # -------------------------
@@ -38,26 +67,27 @@ STATUS_PRECEDENCE = {"completed": 4, "failed": 3, "running": 2, "enqueued": 1}
 # -------------------------
 
 
-def _format_variant_for_filename(variant: str) -> str:
+@lru_cache(maxsize=65536)
+def _glb_filename_stem(product_id: Any, variant: Any, algo: Any) -> str:
     """
-    Format variant string for use in filenames.
+    Build the {product_id}_{variant}_{algo} part of a GLB filename.
 
-    Rules:
-    - Replace spaces with hyphens
-    - Lowercase for consistency
-    - Remove special characters except hyphens and underscores
-    - Use "default" if variant is empty
+    Memoized on the raw row values: the job-independent formatting (NaN
+    handling, float-suffix stripping, variant formatting) repeats for every
+    algorithm run on the same product.
     """
-    if not variant or variant.strip() == "":
-        return "default"
+    # Handle pandas NaN values and convert to strings
+    product_id_str = str(product_id) if not pd.isna(product_id) else "unknown"
+    variant_str = str(variant) if not pd.isna(variant) else ""
+    algo_str = str(algo) if not pd.isna(algo) else "unknown"
+
+    # Strip .0 suffix from product_id if it looks like a float string (e.g., "353481.0" -> "353481")
+    if product_id_str.endswith(".0") and product_id_str[:-2].isdigit():
+        product_id_str = product_id_str[:-2]
 
-    import re
-    formatted = variant.lower().strip().replace(" ", "-")
-    formatted = re.sub(r'[^a-z0-9\-_]', '', formatted)
-    formatted = re.sub(r'-+', '-', formatted)
-    formatted = formatted.strip('-')
+    variant_formatted = format_variant_for_filename(variant_str)
 
-    return formatted if formatted else "default"
+    return f"{product_id_str}_{variant_formatted}_{algo_str}"
 
 
 def _generate_glb_filename(
@@ -71,21 +101,9 @@ def _generate_glb_filename(
 
     Format: {product_id}_{variant}_{algo}_{job_id[:8]}.glb
     """
-    import pandas as pd
-
-    # Handle pandas NaN values and convert to strings
-    product_id_str = str(product_id) if not pd.isna(product_id) else "unknown"
-    variant_str = str(variant) if not pd.isna(variant) else ""
-    algo_str = str(algo) if not pd.isna(algo) else "unknown"
-
-    # Strip .0 suffix from product_id if it looks like a float string (e.g., "353481.0" -> "353481")
-    if product_id_str.endswith(".0") and product_id_str[:-2].isdigit():
-        product_id_str = product_id_str[:-2]
-
-    variant_formatted = _format_variant_for_filename(variant_str)
     job_id_short = job_id[:8]
 
-    return f"{product_id_str}_{variant_formatted}_{algo_str}_{job_id_short}.glb"
+    return f"{_glb_filename_stem(product_id, variant, algo)}_{job_id_short}.glb"
 
 
 # -------------------------
@@ -93,28 +111,13 @@ def _generate_glb_filename(
 # -------------------------
 
 
-def _get_file_timestamp(file_path: Path) -> str | None:
-    """
-    Get file modification timestamp as ISO8601 UTC string.
-
-    Args:
-        file_path: Path to file
-
-    Returns:
-        ISO8601 timestamp string or None if file doesn't exist
-    """
-    if not file_path.exists():
-        return None
-    mtime = file_path.stat().st_mtime
-    dt = datetime.fromtimestamp(mtime, tz=UTC)
-    return dt.isoformat()
-
-
 def _read_marker_timestamp(marker_path: Path) -> str | None:
     """
     Read timestamp from state marker file.
 
-    Marker files contain "timestamp: <ISO8601>" on first line.
+    Marker files contain "timestamp: <ISO8601>" on first line, so only the
+    head of the file is read; the whole file is scanned only if the line
+    isn't there.
 
     Args:
         marker_path: Path to marker file
@@ -122,10 +125,19 @@ def _read_marker_timestamp(marker_path: Path) -> str | None:
     Returns:
         ISO8601 timestamp string or None if file doesn't exist or format is invalid
     """
-    if not marker_path.exists():
-        return None
-
     try:
+        fd = os.open(marker_path, os.O_RDONLY)
+        try:
+            head = os.read(fd, _MARKER_HEAD_BYTES)
+        finally:
+            os.close(fd)
+
+        if head.startswith(b"timestamp:"):
+            end = head.find(b"\n")
+            if end != -1 or len(head) < _MARKER_HEAD_BYTES:
+                line = head if end == -1 else head[:end]
+                return line.decode("utf-8").split(":", 1)[1].strip()
+
         content = marker_path.read_text(encoding="utf-8")
         for line in content.splitlines():
             if line.startswith("timestamp:"):
@@ -136,53 +148,221 @@ def _read_marker_timestamp(marker_path: Path) -> str | None:
     return None
 
 
-def _is_heartbeat_fresh(marker_path: Path, stale_seconds: int = STALE_HEARTBEAT_SECONDS) -> bool:
+def _markers_to_prefetch(state_names: set[str], rows: list[dict[str, Any]]) -> list[str]:
+    """
+    Select the state markers whose timestamps a consolidation pass will use.
+
+    .inprogress markers always feed the heartbeat check; .completed/.failed
+    ones only matter for rows whose timestamps may still be backfilled.
+    """
+    run_job_ids = {row["job_id"] for row in rows}
+    timestamp_job_ids = {row["job_id"] for row in rows if not _has_valid_worker_data(row)}
+    marker_names = []
+    for name in state_names:
+        marker_job_id, _, status = name.rpartition(".")
+        if status == "inprogress":
+            wanted = marker_job_id in run_job_ids
+        else:
+            wanted = status in MARKER_STATUSES and marker_job_id in timestamp_job_ids
+        if wanted:
+            marker_names.append(name)
+    return marker_names
+
+
+def _read_marker_timestamps(state_dir: Path, names: list[str]) -> dict[str, str | None]:
+    """
+    Read the timestamps of many state markers concurrently.
+
+    Marker reads are small and I/O bound (the GIL is released while waiting),
+    so a consolidation pass issues them from a thread pool up front instead
+    of one after another inside the per-job loop.
+
+    Args:
+        state_dir: Path to runs/<run_id>/state/
+        names: Marker file names within state_dir
+
+    Returns:
+        Dictionary mapping each name to its timestamp (None if unreadable)
+    """
+    if not names:
+        return {}
+    workers = min(_MAX_READ_THREADS, len(names))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        timestamps = executor.map(lambda name: _read_marker_timestamp(state_dir / name), names)
+        return dict(zip(names, timestamps, strict=True))
+
+
+def _is_heartbeat_fresh(
+    timestamp_str: str | None,
+    stale_seconds: int = STALE_HEARTBEAT_SECONDS,
+    now: float | None = None,
+) -> bool:
     """
     Check if inprogress marker heartbeat is fresh.
 
     Args:
-        marker_path: Path to .inprogress marker file
+        timestamp_str: Timestamp read from the .inprogress marker
         stale_seconds: Threshold for considering heartbeat stale
+        now: Reference time as a POSIX timestamp; defaults to time.time(). A
+            consolidation pass reads the clock once and passes it here.
 
     Returns:
         True if heartbeat is fresh (< stale_seconds old), False otherwise
     """
-    timestamp_str = _read_marker_timestamp(marker_path)
     if not timestamp_str:
         return False
 
     try:
         marker_time = datetime.fromisoformat(timestamp_str)
-        now = datetime.now(UTC)
-        age_seconds = (now - marker_time).total_seconds()
-        return age_seconds < stale_seconds
-    except Exception:
+    except (TypeError, ValueError):
+        return False
+    # Markers are written in UTC; a naive timestamp can't be placed on the clock
+    if marker_time.tzinfo is None:
         return False
 
+    if now is None:
+        now = time.time()
+    # Fresh when age < stale_seconds, compared as plain epoch seconds
+    return marker_time.timestamp() > now - stale_seconds
+
+
+def _list_dir_names(directory: Path) -> set[str]:
+    """Return the entry names of a directory (empty set if it doesn't exist)."""
+    try:
+        return set(os.listdir(directory))
+    except FileNotFoundError:
+        return set()
+
+
+def _has_valid_worker_data(row: dict[str, Any]) -> bool:
+    """
+    Check whether the worker already recorded real generation timing for a row.
+
+    A duration > 1 second indicates real execution, not marker-derived
+    estimates (typically < 0.1s). Such rows never take timestamps from disk.
+    """
+    existing_duration = row.get("generation_duration_s", 0)
+    if pd.isna(existing_duration):
+        existing_duration = 0
+    return existing_duration > 1.0
+
+
+def _scan_dir(directory: Path) -> dict[str, os.DirEntry]:
+    """Map entry names of a directory to their DirEntry (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _names_digest(names: list[str]) -> str:
+    """Short digest of a list of names (keeps the stamp file small)."""
+    return hashlib.sha1("\n".join(names).encode("utf-8")).hexdigest()
+
+
+def _consolidate_fingerprint(
+    generations_csv_path: Path,
+    state_dir: Path,
+    outputs_dir: Path,
+    options: dict[str, Any],
+) -> dict[str, Any] | None:
+    """
+    Fingerprint the on-disk state a consolidate run reconciles against.
+
+    Covers generations.csv (inode, size, mtime), the state directory (mtime
+    and entry names), the per-job output directories (names and mtimes) and
+    the files in them (names, sizes and mtimes), plus the run options.
+    Markers are written via rename or new files, so a change shows up in the
+    state listing; outputs are also stat-ed one by one, so a GLB or preview
+    overwritten or truncated in place is noticed too.
+
+    Args:
+        generations_csv_path: Path to tables/generations.csv
+        state_dir: runs/<run_id>/state
+        outputs_dir: runs/<run_id>/outputs
+        options: Options that change the result (filters, fix_status, ...)
+
+    Returns:
+        JSON-compatible fingerprint, or None if the result can change without
+        any on-disk change (an .inprogress marker: heartbeat freshness
+        depends on the clock)
+    """
+    state_entries = _scan_dir(state_dir)
+    if any(name.endswith(".inprogress") for name in state_entries):
+        return None
+    state_stat = stat_or_none(state_dir)
+    csv_stat = stat_or_none(generations_csv_path)
+
+    outputs = []
+    for name, entry in _scan_dir(outputs_dir).items():
+        outputs.append(f"{name}:{entry.stat().st_mtime_ns}")
+        if entry.is_dir():
+            for file_name, file_entry in _scan_dir(Path(entry.path)).items():
+                file_stat = file_entry.stat()
+                outputs.append(
+                    f"{name}/{file_name}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+                )
+    outputs.sort()
+    return {
+        "options": options,
+        "generations_csv": (
+            [csv_stat.st_ino, csv_stat.st_size, csv_stat.st_mtime_ns] if csv_stat else None
+        ),
+        "state_dir": [
+            state_stat.st_mtime_ns if state_stat else None,
+            _names_digest(sorted(state_entries)),
+        ],
+        "outputs_dir": _names_digest(outputs),
+    }
+
+
+def _read_cached_summary(stamp_path: Path, fingerprint: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the summary recorded in the stamp file if its fingerprint matches."""
+    try:
+        stamp = read_json(stamp_path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stamp, dict) or stamp.get("fingerprint") != fingerprint:
+        return None
+    return stamp.get("summary")
+
 
 def _gather_evidence(
-    row: pd.Series,
+    row: dict[str, Any],
     run_id: str,
     state_dir: Path,
     outputs_dir: Path,
     paths: PathResolver,
+    state_names: set[str] | None = None,
+    now: float | None = None,
+    marker_timestamps: dict[str, str | None] | None = None,
+    outputs_rel: str | None = None,
 ) -> dict[str, Any]:
     """
     Gather evidence from disk for a single job.
 
     Args:
-        row: Row from generations.csv (may have incomplete/incorrect data)
+        row: Row record from generations.csv (may have incomplete/incorrect data)
         run_id: Run identifier
         state_dir: Path to runs/<run_id>/state/
         outputs_dir: Path to runs/<run_id>/outputs/
         paths: PathResolver instance
+        state_names: Optional listing of state_dir from _list_dir_names(); when
+            given, markers are looked up in it instead of stat-ing each path.
+        now: POSIX reference time for the heartbeat check (defaults to current time)
+        marker_timestamps: Optional timestamps from _read_marker_timestamps();
+            markers missing from it are read here.
+        outputs_rel: Optional workspace-relative POSIX path of outputs_dir;
+            artifact paths are derived from it instead of resolving each file.
 
     Returns:
         Dictionary with evidence keys:
         - has_completed_marker, has_failed_marker, has_inprogress_marker
-        - completed_ts, failed_ts, inprogress_ts (timestamps from markers)
+        - completed_ts, failed_ts, inprogress_ts (timestamps from markers;
+          completed/failed are only read for rows without valid worker data)
         - heartbeat_fresh (bool)
-        - has_generated_glb, glb_size, glb_ts
+        - has_generated_glb, glb_path, glb_rel_path, glb_size, glb_ts
         - preview_paths (list of workspace-relative paths for existing previews)
         - error_txt_content (first ~2000 chars if error.txt exists)
     """
@@ -196,6 +376,8 @@ def _gather_evidence(
         "inprogress_ts": None,
         "heartbeat_fresh": False,
         "has_generated_glb": False,
+        "glb_path": None,
+        "glb_rel_path": None,
         "glb_size": 0,
         "glb_ts": None,
         "preview_paths": [],
@@ -208,18 +390,36 @@ def _gather_evidence(
     inprogress_marker = state_dir / f"{job_id}.inprogress"
     error_txt = state_dir / f"{job_id}.error.txt"
 
-    if completed_marker.exists():
+    if state_names is None:
+        state_names = {
+            p.name for p in (completed_marker, failed_marker, inprogress_marker, error_txt)
+            if p.exists()
+        }
+
+    if marker_timestamps is None:
+        marker_timestamps = {}
+
+    def marker_ts(marker: Path) -> str | None:
+        if marker.name in marker_timestamps:
+            return marker_timestamps[marker.name]
+        return _read_marker_timestamp(marker)
+
+    # Completed/failed timestamps only feed the timestamp backfill, which
+    # rows with worker-recorded timing skip: presence is enough for those
+    needs_timestamps = not _has_valid_worker_data(row)
+
+    if completed_marker.name in state_names:
         evidence["has_completed_marker"] = True
-        evidence["completed_ts"] = _read_marker_timestamp(completed_marker)
+        evidence["completed_ts"] = marker_ts(completed_marker) if needs_timestamps else None
 
-    if failed_marker.exists():
+    if failed_marker.name in state_names:
         evidence["has_failed_marker"] = True
-        evidence["failed_ts"] = _read_marker_timestamp(failed_marker)
+        evidence["failed_ts"] = marker_ts(failed_marker) if needs_timestamps else None
 
-    if inprogress_marker.exists():
+    if inprogress_marker.name in state_names:
         evidence["has_inprogress_marker"] = True
-        evidence["inprogress_ts"] = _read_marker_timestamp(inprogress_marker)
-        evidence["heartbeat_fresh"] = _is_heartbeat_fresh(inprogress_marker)
+        evidence["inprogress_ts"] = marker_ts(inprogress_marker)
+        evidence["heartbeat_fresh"] = _is_heartbeat_fresh(evidence["inprogress_ts"], now=now)
 
     # Check generated GLB file (try new naming first, fallback to legacy)
     job_output_dir = outputs_dir / job_id
@@ -228,38 +428,42 @@ def _gather_evidence(
     new_glb_filename = _generate_glb_filename(
         row["product_id"], row["variant"], row["algo"], job_id
     )
-    new_glb_path = job_output_dir / new_glb_filename
 
-    # Fallback to legacy filename
-    legacy_glb_path = job_output_dir / "generated.glb"
+    # One directory listing answers the GLB and preview lookups below
+    output_entries = _scan_dir(job_output_dir)
+    if outputs_rel is None:
+        outputs_rel = paths.rel_to_workspace(outputs_dir).as_posix()
+    job_output_rel = f"{outputs_rel}/{job_id}"
 
     # Determine which path to use
-    glb_path = None
-    if new_glb_path.exists():
-        glb_path = new_glb_path
-    elif legacy_glb_path.exists():
-        glb_path = legacy_glb_path
+    glb_entry = output_entries.get(new_glb_filename) or output_entries.get(
+        "generated.glb"  # Fallback to legacy filename
+    )
 
-    if glb_path is not None:
+    if glb_entry is not None:
+        glb_stat = glb_entry.stat()
         evidence["has_generated_glb"] = True
-        evidence["glb_size"] = glb_path.stat().st_size
-        evidence["glb_ts"] = _get_file_timestamp(glb_path)
+        evidence["glb_path"] = job_output_dir / glb_entry.name
+        evidence["glb_rel_path"] = f"{job_output_rel}/{glb_entry.name}"
+        evidence["glb_size"] = glb_stat.st_size
+        evidence["glb_ts"] = datetime.fromtimestamp(glb_stat.st_mtime, tz=UTC).isoformat()
 
     # Check preview images
     preview_paths = []
     for i in range(1, 4):
-        preview_path = job_output_dir / f"preview_{i}.png"
-        if preview_path.exists():
+        preview_name = f"preview_{i}.png"
+        if preview_name in output_entries:
             # Store workspace-relative path
-            rel_path = paths.rel_to_workspace(preview_path)
-            preview_paths.append(rel_path.as_posix())
+            preview_paths.append(f"{job_output_rel}/{preview_name}")
     evidence["preview_paths"] = preview_paths
 
     # Read error.txt if present
-    if error_txt.exists():
+    if error_txt.name in state_names:
         try:
-            content = error_txt.read_text(encoding="utf-8")
-            evidence["error_txt_content"] = content[:2000]
+            # Only the first 2000 characters are kept, so don't read a long
+            # traceback in full (text mode still translates newlines)
+            with error_txt.open("r", encoding="utf-8") as f:
+                evidence["error_txt_content"] = f.read(2000)
         except Exception:
             pass
 
@@ -300,18 +504,18 @@ def _determine_desired_status(evidence: dict[str, Any], csv_status: str) -> str:
 
 
 def _reconcile_row(
-    row: pd.Series,
+    row: dict[str, Any],
     evidence: dict[str, Any],
     desired_status: str,
     paths: PathResolver,
     run_id: str,
     fix_status: bool,
-) -> tuple[pd.Series, dict[str, Any]]:
+) -> tuple[dict[str, Any], dict[str, Any]]:
     """
     Reconcile a single row based on evidence and desired status.
 
     Args:
-        row: Row from generations.csv
+        row: Row record from generations.csv
         evidence: Evidence dictionary from _gather_evidence
         desired_status: Desired status from _determine_desired_status
         paths: PathResolver instance
@@ -319,7 +523,9 @@ def _reconcile_row(
         fix_status: If True, apply status downgrades for missing outputs
 
     Returns:
-        Tuple of (reconciled_row, changes_dict)
+        Tuple of (updates, changes_dict)
+        updates maps each column set by reconciliation to its new value
+        (the row itself is not copied; see _apply_row_updates)
         changes_dict tracks what was modified:
         - status_changed, downgraded_missing_output, timestamps_fixed, paths_filled, error_msg_filled
     """
@@ -331,8 +537,9 @@ def _reconcile_row(
         "error_msg_filled": False,
     }
 
-    reconciled = row.copy()
-    job_id = row["job_id"]
+    # Writes land in the updates dict; reads see them over the original row
+    updates: dict[str, Any] = {}
+    reconciled = ChainMap(updates, row)
 
     # Handle status reconciliation
     csv_status = row.get("status", "")
@@ -347,12 +554,8 @@ def _reconcile_row(
         reconciled["status"] = desired_status
         changes["status_changed"] = True
 
-    # Check if worker already wrote valid timestamps (duration > 1 second indicates
-    # real execution, not marker-derived estimates which are typically < 0.1s)
-    existing_duration = row.get("generation_duration_s", 0)
-    if pd.isna(existing_duration):
-        existing_duration = 0
-    has_valid_worker_data = existing_duration > 1.0
+    # Check if worker already wrote valid timestamps
+    has_valid_worker_data = _has_valid_worker_data(row)
 
     # Only fill timestamps from markers if worker data is missing/invalid
     if not has_valid_worker_data:
@@ -381,37 +584,16 @@ def _reconcile_row(
                 reconciled["generation_end"] = latest
                 changes["timestamps_fixed"] = True
 
-        # Only recompute duration if we just filled timestamps (worker data was missing)
+        # Only recompute duration if we just filled timestamps (worker data was missing).
+        # The value is computed for all such rows at once by _fill_durations;
+        # the placeholder keeps the column at its usual position
         if changes.get("timestamps_fixed") and reconciled.get("generation_start") and reconciled.get("generation_end"):
-            try:
-                start = datetime.fromisoformat(str(reconciled["generation_start"]))
-                end = datetime.fromisoformat(str(reconciled["generation_end"]))
-                duration = max((end - start).total_seconds(), 0)
-                reconciled["generation_duration_s"] = duration
-            except Exception:
-                pass
+            reconciled["generation_duration_s"] = _DURATION_PENDING
 
     # Fill output paths
     if evidence["has_generated_glb"]:
-        job_output_dir = paths.outputs_dir(run_id, job_id=job_id)
-
-        # Try new filename format first, fallback to legacy
-        new_glb_filename = _generate_glb_filename(
-            row["product_id"], row["variant"], row["algo"], job_id
-        )
-        new_glb_path = job_output_dir / new_glb_filename
-        legacy_glb_path = job_output_dir / "generated.glb"
-
-        # Use whichever file exists
-        if new_glb_path.exists():
-            glb_path = new_glb_path
-        elif legacy_glb_path.exists():
-            glb_path = legacy_glb_path
-        else:
-            # Shouldn't happen if evidence["has_generated_glb"] is True, but be defensive
-            glb_path = new_glb_path  # Default to new format
-
-        rel_glb = paths.rel_to_workspace(glb_path).as_posix()
+        # Resolved by _gather_evidence (new filename format first, then legacy)
+        rel_glb = evidence["glb_rel_path"]
 
         if pd.isna(row.get("gen_object_path")) or not row.get("gen_object_path"):
             reconciled["gen_object_path"] = rel_glb
@@ -438,10 +620,78 @@ def _reconcile_row(
                 reconciled["error_msg"] = content
             changes["error_msg_filled"] = True
 
-    return reconciled, changes
+    return updates, changes
+
+
+def _fill_durations(rows: list[dict[str, Any]], row_updates: list[dict[str, Any]]) -> None:
+    """
+    Compute the durations _reconcile_row left pending, in one vectorized pass.
 
+    Timestamps are parsed column-wise as ISO 8601 (UTC); a duration is
+    clipped at 0, and rows whose timestamps do not parse keep their value.
 
-def _merge_duplicate_rows(rows: list[pd.Series]) -> pd.Series:
+    Args:
+        rows: Original rows
+        row_updates: Per-row updates from _reconcile_row (modified in place)
+    """
+    pending = [
+        (row, updates)
+        for row, updates in zip(rows, row_updates, strict=True)
+        if updates.get("generation_duration_s") is _DURATION_PENDING
+    ]
+    if not pending:
+        return
+
+    def parse(col: str) -> pd.Series:
+        values = [str(ChainMap(updates, row)[col]) for row, updates in pending]
+        return pd.to_datetime(pd.Series(values), format="ISO8601", utc=True, errors="coerce")
+
+    seconds = (parse("generation_end") - parse("generation_start")).dt.total_seconds()
+    for (_, updates), duration in zip(pending, seconds.tolist(), strict=True):
+        if pd.isna(duration):
+            del updates["generation_duration_s"]
+        else:
+            updates["generation_duration_s"] = max(duration, 0)
+
+
+def _apply_row_updates(df: pd.DataFrame, row_updates: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build the reconciled frame from the original rows and their updates.
+
+    Only columns that some row updates are rebuilt (as value lists); the
+    others are carried over as arrays. Columns introduced by updates are
+    appended in order of first appearance and are NaN for the other rows.
+
+    Args:
+        df: Original rows, in the order of row_updates
+        row_updates: Per-row updates from _reconcile_row
+
+    Returns:
+        New DataFrame with a fresh RangeIndex
+    """
+    updated: dict[str, list[Any]] = {}
+    for pos, updates in enumerate(row_updates):
+        for col, value in updates.items():
+            if col not in updated:
+                updated[col] = (
+                    df[col].tolist() if col in df.columns else [float("nan")] * len(df)
+                )
+            updated[col][pos] = value
+
+    data: dict[str, Any] = {}
+    for col in df.columns:
+        if col in updated:
+            data[col] = updated.pop(col)
+        elif isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Decode to plain values, inferred like any rebuilt column
+            data[col] = df[col].tolist()
+        else:
+            data[col] = df[col].to_numpy()
+    data.update(updated)
+    return pd.DataFrame(data)
+
+
+def _merge_duplicate_rows(df: pd.DataFrame) -> pd.DataFrame:
     """
     Merge duplicate (run_id, job_id) rows by keeping most complete information.
 
@@ -451,45 +701,83 @@ def _merge_duplicate_rows(rows: list[pd.Series]) -> pd.Series:
     3. For paths, prefer existing file paths over empty
     4. Keep widest set of non-empty columns
 
+    All groups are merged at once: rows are ordered by precedence within
+    their group, and each column takes the group's first non-empty value
+    (falling back to the top row's own value when every row is empty).
+
     Args:
-        rows: List of Series representing duplicate rows
+        df: Reconciled rows, possibly with duplicate (run_id, job_id) keys
 
     Returns:
-        Merged Series with union of non-empty fields
+        One row per (run_id, job_id), ordered by key
     """
-    if len(rows) == 1:
-        return rows[0]
-
-    # Sort by status precedence (highest first)
-    rows_sorted = sorted(
-        rows,
-        key=lambda r: STATUS_PRECEDENCE.get(r.get("status", "enqueued"), 0),
-        reverse=True,
+    keys = ["run_id", "job_id"]
+    rank = df["status"].map(STATUS_PRECEDENCE).fillna(0)
+    ordered = (
+        df.assign(_rank=rank)
+        .sort_values([*keys, "_rank"], ascending=[True, True, False], kind="stable")
+        .drop(columns="_rank")
     )
 
-    # Start with highest precedence row
-    merged = rows_sorted[0].copy()
+    # Prefer non-NaN, non-empty values: blank out "" so first() skips it
+    first_non_empty = ordered.mask(ordered == "").groupby(keys, sort=True).first()
+    top_rows = ordered.drop_duplicates(keys).set_index(keys).reindex(first_non_empty.index)
+    merged = first_non_empty.where(first_non_empty.notna(), top_rows)
 
-    # Merge columns from other rows (prefer non-empty)
-    for row in rows_sorted[1:]:
-        for col in row.index:
-            # Skip if column not in merged yet
-            if col not in merged.index:
-                merged[col] = row[col]
-                continue
+    return merged.reset_index()[list(df.columns)]
 
-            merged_val = merged[col]
-            row_val = row[col]
 
-            # Prefer non-NaN, non-empty values
-            if pd.isna(merged_val) or merged_val == "":
-                if not pd.isna(row_val) and row_val != "":
-                    merged[col] = row_val
-            elif isinstance(merged_val, (int, float)) and pd.isna(merged_val):
-                if not pd.isna(row_val):
-                    merged[col] = row_val
+def _replace_run_rows(
+    generations_csv_path: Path,
+    run_id: str,
+    df_reconciled: pd.DataFrame,
+    df_loaded: pd.DataFrame,
+    loaded_stat: os.stat_result,
+) -> None:
+    """
+    Replace every generations.csv row of a run with the reconciled rows.
 
-    return merged
+    The new table is assembled and serialized from df_loaded (the table as
+    read at loaded_stat) before the lock is taken, into a per-process temp
+    file. Under the lock, only a stat confirms nobody wrote the table in
+    between and the file is swapped in; otherwise the table is re-read and
+    rewritten while holding the lock.
+
+    Args:
+        generations_csv_path: Path to tables/generations.csv
+        run_id: Run whose rows are replaced
+        df_reconciled: Deduplicated rows for the run
+        df_loaded: generations.csv as read earlier by the caller
+        loaded_stat: os.stat() of generations.csv taken before that read
+    """
+    from filelock import FileLock  # noqa: PLC0415
+
+    lock_path = generations_csv_path.with_suffix(".lock")
+    tmp_path = generations_csv_path.with_name(
+        f"{generations_csv_path.name}.{os.getpid()}.tmp"
+    )
+
+    def write_tmp(df_full: pd.DataFrame) -> None:
+        df_other_runs = df_full[df_full["run_id"] != run_id]
+        df_final = pd.concat([df_other_runs, df_reconciled], ignore_index=True)
+        write_csv_arrow(df_final, tmp_path)
+
+    try:
+        write_tmp(df_loaded)
+        with FileLock(lock_path, timeout=30):
+            current_stat = stat_or_none(generations_csv_path)
+            if current_stat is None or (current_stat.st_mtime_ns, current_stat.st_size) != (
+                loaded_stat.st_mtime_ns,
+                loaded_stat.st_size,
+            ):
+                # Another writer got in first: rebuild from the current table
+                write_tmp(pd.read_csv(
+                    generations_csv_path, encoding="utf-8-sig", dtype=_GENERATIONS_DTYPES
+                ))
+            os.replace(tmp_path, generations_csv_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _consolidate_run(
@@ -537,10 +825,28 @@ def _consolidate_run(
             "status_histogram_after": {},
         }
 
+    # A run that changed nothing records a fingerprint of what it saw; as
+    # long as nothing on disk changed since, the result is the same summary
+    stamp_path = paths.run_dir(run_id) / _STAMP_FILENAME
+    fingerprint_options = {
+        "only_status": only_status,
+        "fix_status": fix_status,
+        "max_rows": max_rows,
+    }
+    fingerprint = None
+    if not dry_run:
+        fingerprint = _consolidate_fingerprint(
+            generations_csv_path, state_dir, outputs_dir, fingerprint_options
+        )
+        cached = _read_cached_summary(stamp_path, fingerprint) if fingerprint else None
+        if cached is not None:
+            return cached
+
+    # Stat before reading: if the file changes after this point, the
+    # duplicate rewrite below sees a different stamp and reads it again
+    csv_stat = os.stat(generations_csv_path)
     df = pd.read_csv(
-        generations_csv_path,
-        encoding="utf-8-sig",
-        dtype={"product_id": str, "variant": str},
+        generations_csv_path, encoding="utf-8-sig", dtype=_GENERATIONS_DTYPES
     )
 
     # Filter by run_id
@@ -571,11 +877,12 @@ def _consolidate_run(
             "status_histogram_after": {},
         }
 
-    # Compute status histogram before
-    status_histogram_before = df_run["status"].value_counts().to_dict()
+    # Compute status histogram before (as plain values: a categorical
+    # value_counts() would also list every other run's statuses with 0)
+    status_histogram_before = df_run["status"].astype(object).value_counts().to_dict()
 
     # Gather evidence and reconcile each row
-    reconciled_rows = []
+    row_updates = []
     total_changes = {
         "status_changed": 0,
         "downgraded_missing_output": 0,
@@ -584,54 +891,97 @@ def _consolidate_run(
         "error_msg_filled": 0,
     }
 
-    for _, row in df_run.iterrows():
-        evidence = _gather_evidence(row, run_id, state_dir, outputs_dir, paths)
+    # List the state directory once instead of probing 4 paths per job, and
+    # judge every heartbeat against the same clock reading
+    state_names = _list_dir_names(state_dir)
+    now = time.time()
+
+    # Plain dict records: building a Series per row dominated the loop
+    rows = df_run.to_dict("records")
+
+    # Read all of this run's markers that matter in one concurrent batch:
+    # .inprogress for the heartbeat, .completed/.failed only for jobs whose
+    # timestamps may still be backfilled (a re-run over a reconciled run
+    # reads next to nothing)
+    marker_names = _markers_to_prefetch(state_names, rows)
+    marker_timestamps = _read_marker_timestamps(state_dir, marker_names)
+
+    # Resolve the outputs directory against the workspace once; per-job
+    # artifact paths below it are plain string joins
+    outputs_rel = paths.rel_to_workspace(outputs_dir).as_posix()
+
+    # Evidence gathering is directory scans and small reads per job, so it
+    # runs on a thread pool; reconciliation below stays sequential
+    def gather(row: dict[str, Any]) -> dict[str, Any]:
+        return _gather_evidence(
+            row,
+            run_id,
+            state_dir,
+            outputs_dir,
+            paths,
+            state_names,
+            now,
+            marker_timestamps,
+            outputs_rel,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_THREADS, len(rows))) as executor:
+        evidences = list(executor.map(gather, rows))
+
+    for row, evidence in zip(rows, evidences, strict=True):
         csv_status = row.get("status", "enqueued")
         desired_status = _determine_desired_status(evidence, csv_status)
 
-        reconciled, changes = _reconcile_row(
+        updates, changes = _reconcile_row(
             row, evidence, desired_status, paths, run_id, fix_status
         )
-        reconciled_rows.append(reconciled)
+        row_updates.append(updates)
 
         # Aggregate changes
         for key in changes:
             if changes[key]:
                 total_changes[key] += 1
 
+    _fill_durations(rows, row_updates)
+
     # Convert to DataFrame
-    df_reconciled = pd.DataFrame(reconciled_rows)
+    df_reconciled = _apply_row_updates(df_run, row_updates)
 
     # Handle duplicates (merge by run_id, job_id)
     duplicate_groups = df_reconciled.groupby(["run_id", "job_id"])
-    conflicts_resolved = sum(1 for _, group in duplicate_groups if len(group) > 1)
+    conflicts_resolved = int((duplicate_groups.size() > 1).sum())
 
     if conflicts_resolved > 0:
-        merged_rows = []
-        for (_rid, _jid), group in duplicate_groups:
-            rows_list = [row for _, row in group.iterrows()]
-            merged = _merge_duplicate_rows(rows_list)
-            merged_rows.append(merged)
-        df_reconciled = pd.DataFrame(merged_rows)
+        df_reconciled = _merge_duplicate_rows(df_reconciled)
 
     # Compute status histogram after
     status_histogram_after = df_reconciled["status"].value_counts().to_dict()
 
     # Determine unchanged count (compare before/after on job_id basis)
     # Unchanged = rows where reconciled matches original
+    # Simple heuristic: unchanged if status and key fields match. Reconciled
+    # rows are indexed by job_id once instead of scanning the frame per row.
+    key_cols = ("status", "gen_object_path", "error_msg")
+
+    def key_columns(df: pd.DataFrame) -> list[list[Any]]:
+        # Absent columns read as None, like Series.get()
+        return [df[c].tolist() if c in df.columns else [None] * len(df) for c in key_cols]
+
+    rec_job_ids = df_reconciled["job_id"].tolist()
+    job_id_counts = Counter(rec_job_ids)
+    rec_keys = {
+        job_id: key
+        for job_id, *key in zip(rec_job_ids, *key_columns(df_reconciled), strict=True)
+        if job_id_counts[job_id] == 1
+    }
     unchanged = 0
-    for _, orig_row in df_run.iterrows():
-        job_id = orig_row["job_id"]
-        reconciled_match = df_reconciled[df_reconciled["job_id"] == job_id]
-        if len(reconciled_match) == 1:
-            rec = reconciled_match.iloc[0]
-            # Simple heuristic: unchanged if status and key fields match
-            if (
-                orig_row.get("status") == rec.get("status")
-                and orig_row.get("gen_object_path") == rec.get("gen_object_path")
-                and orig_row.get("error_msg") == rec.get("error_msg")
-            ):
-                unchanged += 1
+    for job_id, *orig_key in zip(df_run["job_id"], *key_columns(df_run), strict=True):
+        rec_key = rec_keys.get(job_id)
+        # Compare field by field: NaN never equals NaN, as in the scalar check
+        if rec_key is not None and all(
+            a == b for a, b in zip(orig_key, rec_key, strict=True)
+        ):
+            unchanged += 1
 
     # Upsert to CSV (unless dry-run)
     upsert_inserted = 0
@@ -640,38 +990,11 @@ def _consolidate_run(
         # Special handling for duplicates: remove all rows for this run_id first,
         # then insert the deduplicated/merged rows as new inserts
         if conflicts_resolved > 0:
-            # Read full CSV, remove duplicates for this run_id, then add merged rows
-            from filelock import FileLock
-
-            lock_path = generations_csv_path.with_suffix(".lock")
+            # Remove all rows for this run_id (including duplicates), then add merged rows
+            _replace_run_rows(generations_csv_path, run_id, df_reconciled, df, csv_stat)
 
-            with FileLock(lock_path, timeout=30):
-                df_full = pd.read_csv(
-                    generations_csv_path,
-                    encoding="utf-8-sig",
-                    dtype={"product_id": str, "variant": str},
-                )
-
-                # Remove all rows for this run_id (including duplicates)
-                df_other_runs = df_full[df_full["run_id"] != run_id]
-
-                # Append reconciled rows
-                df_final = pd.concat([df_other_runs, df_reconciled], ignore_index=True)
-
-                # Write atomically
-                tmp_path = generations_csv_path.with_suffix(".tmp")
-                try:
-                    df_final.to_csv(tmp_path, index=False, encoding="utf-8-sig")
-                    import os
-
-                    os.replace(tmp_path, generations_csv_path)
-                except Exception:
-                    if tmp_path.exists():
-                        tmp_path.unlink()
-                    raise
-
-                # Count as updates (approximate - all rows for this run_id)
-                upsert_updated = len(df_reconciled)
+            # Count as updates (approximate - all rows for this run_id)
+            upsert_updated = len(df_reconciled)
         else:
             # No duplicates detected, use normal upsert
             upsert_inserted, upsert_updated = upsert_generations(
@@ -693,6 +1016,19 @@ def _consolidate_run(
         "status_histogram_after": status_histogram_after,
     }
 
+    # Nothing to reconcile: record the fingerprint (with generations.csv as
+    # just written) so an unchanged re-run can return this summary directly
+    if fingerprint and conflicts_resolved == 0 and not any(total_changes.values()):
+        fingerprint = _consolidate_fingerprint(
+            generations_csv_path, state_dir, outputs_dir, fingerprint_options
+        )
+        if fingerprint:
+            write_text_atomic(
+                stamp_path,
+                json.dumps({"fingerprint": fingerprint, "summary": summary}),
+                fsync=False,
+            )
+
     # Strict mode: fail on conflicts
     if strict and (conflicts_resolved > 0 or total_changes["downgraded_missing_output"] > 0):
         raise RuntimeError(
@@ -17,14 +17,26 @@ This module implements the `archi3d run worker` command, which:
 from __future__ import annotations
 
 import getpass
+import itertools
+import multiprocessing
 import os
+import re
 import socket
 import subprocess
 import sys
+import threading
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -42,47 +54,26 @@ from archi3d.config.adapters_cfg import load_adapters_cfg
 from archi3d.config.loader import _find_repo_root
 from archi3d.config.paths import PathResolver
 from archi3d.db.generations import upsert_generations
-from archi3d.utils.io import append_log_record, write_text_atomic
+from archi3d.utils.io import (
+    LogWriter,
+    append_log_record,
+    stat_or_none,
+)
+from archi3d.utils.text import format_variant_for_filename, job_filter_regex
+
+EXECUTOR_KINDS = ("thread", "process")
+_SUBMIT_WINDOW_FACTOR = 2  # jobs in flight per worker slot
+
+# Columns run_worker reads: generations.csv for filtering and job identity,
+# the manifest for the input images
+_GEN_COLS = ["run_id", "job_id", "status", "algo", "product_id", "variant"]
+_MANIFEST_COLS = ["job_id", *(f"used_image_{i}_path" for i in range(1, 7))]
 
 # -------------------------
 # File Naming Helpers
 # -------------------------
 
 
-def _format_variant_for_filename(variant: str) -> str:
-    """
-    Format variant string for use in filenames.
-
-    Rules:
-    - Replace spaces with hyphens
-    - Lowercase for consistency
-    - Remove special characters except hyphens and underscores
-    - Use "default" if variant is empty
-
-    Examples:
-        "Curved backrest" -> "curved-backrest"
-        "Model-A" -> "model-a"
-        "" -> "default"
-    """
-    if not variant or variant.strip() == "":
-        return "default"
-
-    # Lowercase and replace spaces with hyphens
-    formatted = variant.lower().strip().replace(" ", "-")
-
-    # Keep only alphanumeric, hyphens, and underscores
-    import re
-    formatted = re.sub(r'[^a-z0-9\-_]', '', formatted)
-
-    # Collapse multiple hyphens
-    formatted = re.sub(r'-+', '-', formatted)
-
-    # Remove leading/trailing hyphens
-    formatted = formatted.strip('-')
-
-    return formatted if formatted else "default"
-
-
 def _generate_glb_filename(
     product_id: str,
     variant: str,
@@ -109,7 +100,7 @@ def _generate_glb_filename(
         >>> _generate_glb_filename("123456", "", "meshy_v4_multi", "b2c3d4e5f6...")
         "123456_default_meshy_v4_multi_b2c3d4e5.glb"
     """
-    variant_formatted = _format_variant_for_filename(variant)
+    variant_formatted = format_variant_for_filename(variant)
     job_id_short = job_id[:8]
 
     return f"{product_id}_{variant_formatted}_{algo}_{job_id_short}.glb"
@@ -120,18 +111,40 @@ def _generate_glb_filename(
 # -------------------------
 
 
-def _get_worker_identity() -> dict[str, str]:
-    """
-    Capture worker environment metadata for observability.
+def _nvml_gpu_name() -> str:
+    """First GPU's name via NVML (pynvml, optional), or "" if unavailable."""
+    try:
+        import pynvml  # noqa: PLC0415
+    except ImportError:
+        return ""
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        return ""
+    try:
+        if pynvml.nvmlDeviceGetCount() == 0:
+            return ""
+        name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+        # Older pynvml releases return bytes
+        return name.decode() if isinstance(name, bytes) else name
+    except Exception:
+        return ""
+    finally:
+        pynvml.nvmlShutdown()
 
-    Returns:
-        Dict with keys: host, user, gpu, env, commit
+
+@lru_cache(maxsize=1)
+def _detect_gpu() -> str:
     """
-    host = socket.gethostname()
-    user = getpass.getuser()
+    Name of the first GPU, or "" if none is found (best effort).
 
-    # GPU detection (best effort)
-    gpu = ""
+    Asks NVML in-process when pynvml is installed, then falls back to
+    nvidia-smi and torch. Cached: the GPU does not change within a process,
+    and nvidia-smi costs a fork/exec per call.
+    """
+    gpu = _nvml_gpu_name()
+    if gpu:
+        return gpu
     try:
         # Try nvidia-smi
         result = subprocess.run(
@@ -152,6 +165,21 @@ def _get_worker_identity() -> dict[str, str]:
                 gpu = torch.cuda.get_device_name(0)
         except Exception:
             pass
+    return gpu
+
+
+def _get_worker_identity() -> dict[str, str]:
+    """
+    Capture worker environment metadata for observability.
+
+    Returns:
+        Dict with keys: host, user, gpu, env, commit
+    """
+    host = socket.gethostname()
+    user = getpass.getuser()
+
+    # GPU detection (best effort, once per process)
+    gpu = _detect_gpu()
 
     # Environment string
     env = f"python {sys.version.split()[0]}"
@@ -183,26 +211,126 @@ def _get_state_marker_path(state_dir: Path, job_id: str, status: str) -> Path:
     return state_dir / f"{job_id}.{status}"
 
 
+_MARKER_STATUSES = ("completed", "failed", "inprogress")  # in precedence order
+
+# Marker status per job_id for each state dir, from one listing plus this
+# process's own marker writes (see _check_state_marker)
+_state_cache: dict[Path, dict[str, str]] = {}
+_state_cache_guard = threading.Lock()
+
+
+def _load_state_cache(state_dir: Path) -> dict[str, str]:
+    """Return the marker cache of state_dir, listing the directory on first use."""
+    with _state_cache_guard:
+        cache = _state_cache.get(state_dir)
+        if cache is None:
+            cache = {}
+            names = _list_state_markers(state_dir)
+            # Lowest precedence first, so the highest marker present wins
+            for status in reversed(_MARKER_STATUSES):
+                suffix = f".{status}"
+                for name in names:
+                    if name.endswith(suffix):
+                        cache[name[: -len(suffix)]] = status
+            _state_cache[state_dir] = cache
+        return cache
+
+
+def _reset_state_cache(state_dir: Path) -> None:
+    """Forget the cached markers of state_dir (re-listed on next use)."""
+    with _state_cache_guard:
+        _state_cache.pop(state_dir, None)
+
+
 def _check_state_marker(state_dir: Path, job_id: str) -> str | None:
     """
     Check for existing state markers and return the status if found.
 
+    Looks the job up in the cached directory listing. Finished markers are
+    only removed by --redo (before the cache is built), so a cached
+    completed/failed is final. Anything else is re-checked on disk when
+    other worker processes may share the workspace.
+
     Returns:
         Status string ("inprogress", "completed", "failed") or None if no marker.
     """
-    for status in ["completed", "failed", "inprogress"]:
+    cache = _load_state_cache(state_dir)
+    cached = cache.get(job_id)
+    if cached in ("completed", "failed") or not _cross_process_locking():
+        return cached
+
+    for status in _MARKER_STATUSES:
         marker = _get_state_marker_path(state_dir, job_id, status)
         if marker.exists():
+            cache[job_id] = status
             return status
+    cache.pop(job_id, None)
     return None
 
 
+def _write_marker_fast(path: Path, content: str) -> None:
+    """
+    Write a state marker atomically (temp file + rename), without fsync.
+
+    Markers are best-effort durable: generations.csv is the source of truth
+    and consolidate reconciles markers against it. The state directory
+    already exists (PathResolver.state_dir creates it), and the temp name
+    carries the pid so concurrent worker processes never share it.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_text(content, encoding="utf-8", newline="\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_error_file(path: Path, message: str) -> None:
+    """
+    Write a job's error and the traceback being handled (temp file + rename).
+
+    The traceback is printed straight into the file rather than formatted
+    into one string first. Must be called from an except block.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="\n") as f:
+            f.write(f"Error: {message}\n\nTraceback:\n")
+            traceback.print_exc(file=f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _record_job_error(state_dir: Path, job_id: str, exc: Exception) -> str:
+    """
+    Write a job's full error to <job_id>.error.txt and return the CSV message.
+
+    The message is truncated to 2000 characters. Must be called from the
+    except block handling ``exc`` (see _write_error_file).
+    """
+    full_error = str(exc)
+    error_msg = full_error[:2000]  # Truncate to 2000 chars
+    if len(full_error) > 2000:
+        error_msg += " (truncated; see error.txt)"
+
+    # Write full error to error.txt
+    _write_error_file(state_dir / f"{job_id}.error.txt", full_error)
+    return error_msg
+
+
 def _create_state_marker(state_dir: Path, job_id: str, status: str, content: str = "") -> None:
     """Create a state marker file with optional content."""
     marker = _get_state_marker_path(state_dir, job_id, status)
     timestamp = datetime.now(UTC).isoformat()
     marker_content = f"timestamp: {timestamp}\npid: {os.getpid()}\n{content}"
-    write_text_atomic(marker, marker_content)
+    _write_marker_fast(marker, marker_content)
+
+    cache = _state_cache.get(state_dir)
+    if cache is not None:
+        cache[job_id] = status
 
 
 def _transition_state_marker(
@@ -214,8 +342,7 @@ def _transition_state_marker(
     Removes old marker and creates new marker.
     """
     old_marker = _get_state_marker_path(state_dir, job_id, old_status)
-    if old_marker.exists():
-        old_marker.unlink()
+    old_marker.unlink(missing_ok=True)
 
     _create_state_marker(state_dir, job_id, new_status, content)
 
@@ -233,23 +360,101 @@ def _is_stale_heartbeat(state_dir: Path, job_id: str, stale_seconds: int = 600)
         True if inprogress marker exists and is older than stale_seconds
     """
     marker = _get_state_marker_path(state_dir, job_id, "inprogress")
-    if not marker.exists():
+    st = stat_or_none(marker)
+    if st is None:
         return False
 
-    age = time.time() - marker.stat().st_mtime
+    age = time.time() - st.st_mtime
     return age > stale_seconds
 
 
-def _clear_state_markers(state_dir: Path, job_id: str) -> None:
+def _reap_stale_markers(state_dir: Path, stale_seconds: int = 600) -> int:
+    """
+    Delete .inprogress markers whose heartbeat is stale (see _is_stale_heartbeat).
+
+    Such markers are left behind by workers that crashed mid-job.
+
+    Returns:
+        Number of markers removed
+    """
+    cutoff = time.time() - stale_seconds
+    reaped = 0
+    try:
+        with os.scandir(state_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".inprogress"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        reaped += 1
+                except FileNotFoundError:
+                    # Finished (or reaped) by another worker meanwhile
+                    pass
+    except FileNotFoundError:
+        pass
+    return reaped
+
+
+def _list_state_markers(state_dir: Path) -> set[str]:
+    """Return the file names currently in state_dir (one directory listing)."""
+    try:
+        return set(os.listdir(state_dir))
+    except FileNotFoundError:
+        return set()
+
+
+def _clear_state_markers(
+    state_dir: Path, job_id: str, existing: set[str] | None = None
+) -> None:
     """
     Remove all state markers for a job, allowing re-execution.
 
     Used by --redo flag to clear completed/failed markers before retry.
+
+    Args:
+        state_dir: State directory path
+        job_id: Job ID
+        existing: Optional names from _list_state_markers(); when given, only
+            markers in it are unlinked instead of probing each path.
     """
     for status in ["completed", "failed", "inprogress"]:
         marker = _get_state_marker_path(state_dir, job_id, status)
-        if marker.exists():
-            marker.unlink()
+        if existing is None:
+            if marker.exists():
+                marker.unlink()
+        elif marker.name in existing:
+            marker.unlink(missing_ok=True)
+
+
+# In-process per-job locks, used when no other worker process shares the
+# workspace (see _job_lock)
+_job_locks: dict[tuple[str, str], threading.Lock] = {}
+_job_locks_guard = threading.Lock()
+
+
+def _cross_process_locking() -> bool:
+    """Whether other worker processes may share the workspace (ARCHI3D_CROSS_PROC_LOCK)."""
+    return os.environ.get("ARCHI3D_CROSS_PROC_LOCK", "1") != "0"
+
+
+def _job_lock(paths: PathResolver, run_id: str, job_id: str) -> Any:
+    """
+    Lock guarding a job's state marker transitions.
+
+    A FileLock by default, so worker processes sharing the workspace exclude
+    each other. With ARCHI3D_CROSS_PROC_LOCK=0 (a single worker process) a
+    threading.Lock per job is enough and skips the lock file round trips.
+    """
+    if _cross_process_locking():
+        return FileLock(paths.state_lock_path(run_id, job_id), timeout=30)
+
+    key = (run_id, job_id)
+    lock = _job_locks.get(key)
+    if lock is None:
+        with _job_locks_guard:
+            lock = _job_locks.setdefault(key, threading.Lock())
+    return lock
 
 
 def _reload_dotenv() -> None:
@@ -312,22 +517,134 @@ def _simulate_dry_run(
         previews.append(preview_path)
 
     # Simulate processing time
-    time.sleep(0.1)
+    delay = _dry_run_sleep()
+    if delay > 0:
+        time.sleep(delay)
 
     return glb_path, previews
 
 
+def _dry_run_sleep() -> float:
+    """Simulated seconds per dry-run job (env ARCHI3D_DRY_RUN_SLEEP, default 0.1)."""
+    return float(os.getenv("ARCHI3D_DRY_RUN_SLEEP", "0.1"))
+
+
+def _execute_dry_run_fast(
+    job_row: dict[str, Any],
+    paths: PathResolver,
+    worker_identity: dict,
+) -> dict[str, Any]:
+    """
+    Simulate a job without locks or the intermediate inprogress marker.
+
+    Dry runs are not meant to be concurrency-safe, so the job lock and the
+    inprogress state are skipped; the completed (or failed) marker is still
+    written so a later run (dry or real) skips the job as usual. A failing
+    simulation is recorded like in _execute_job: error.txt, failed marker
+    and a failed record.
+
+    Returns:
+        Same shape as _execute_job.
+    """
+    run_id = job_row["run_id"]
+    job_id = job_row["job_id"]
+
+    state_dir = paths.state_dir(run_id)
+    existing_state = _check_state_marker(state_dir, job_id)
+    if existing_state in ["completed", "failed"]:
+        return {"skipped": True, "reason": f"already_{existing_state}"}
+
+    start_wall = time.time()
+    start_mono = time.monotonic_ns()
+    record = {
+        "run_id": run_id,
+        "job_id": job_id,
+        "status": "failed",
+        "generation_start": datetime.fromtimestamp(start_wall, UTC).isoformat(),
+        "generation_end": "",
+        "generation_duration_s": 0.0,
+        "algo_version": "",
+        "unit_price_usd": 0.0,
+        "price_source": "unknown",
+        "gen_object_path": "",
+        "preview_1_path": "",
+        "preview_2_path": "",
+        "preview_3_path": "",
+        "error_msg": "",
+        **worker_identity,
+    }
+
+    try:
+        gen_glb_path, previews = _simulate_dry_run(
+            job_row["product_id"],
+            job_row["variant"],
+            job_row["algo"],
+            job_id,
+            paths.outputs_dir(run_id, job_id=job_id),
+        )
+    except Exception as e:
+        record["error_msg"] = _record_job_error(state_dir, job_id, e)
+    else:
+        record["status"] = "completed"
+        record["algo_version"] = "dry-run"
+        record["price_source"] = "dry-run"
+        record["gen_object_path"] = paths.rel_to_workspace(gen_glb_path).as_posix()
+        for i, preview_path in enumerate(previews[:3], start=1):
+            record[f"preview_{i}_path"] = paths.rel_to_workspace(preview_path).as_posix()
+
+    record["generation_duration_s"] = (time.monotonic_ns() - start_mono) / 1e9
+    record["generation_end"] = datetime.fromtimestamp(time.time(), UTC).isoformat()
+
+    _create_state_marker(state_dir, job_id, record["status"])
+    return record
+
+
+# -------------------------
+# Input Image Checks
+# -------------------------
+
+# Directory listings of input images, shared by the job threads of a run
+# (jobs of one product use images from the same folder)
+_dir_listing_cache: dict[Path, frozenset[str]] = {}
+_dir_listing_guard = threading.Lock()
+_DIR_LISTING_CACHE_MAX = 4096  # directories; the cache is emptied when reached
+
+
+def _file_exists(root: Path, relpath: str) -> bool:
+    """
+    Check whether root/relpath exists, listing each parent directory once.
+
+    A name missing from the listing is confirmed with a stat, so
+    case-insensitive file systems behave as with Path.exists().
+    """
+    path = root / relpath
+    parent = path.parent
+    listing = _dir_listing_cache.get(parent)
+    if listing is None:
+        try:
+            listing = frozenset(os.listdir(parent))
+        except (FileNotFoundError, NotADirectoryError):
+            listing = frozenset()
+        with _dir_listing_guard:
+            if len(_dir_listing_cache) >= _DIR_LISTING_CACHE_MAX:
+                _dir_listing_cache.clear()
+            _dir_listing_cache[parent] = listing
+    return path.name in listing or stat_or_none(path) is not None
+
+
 # -------------------------
 # Job Execution
 # -------------------------
 
 
 def _execute_job(
-    job_row: pd.Series,
+    job_row: dict[str, Any],
     paths: PathResolver,
     adapters_cfg: dict,
     worker_identity: dict,
     dry_run: bool,
+    *,
+    stop_event: threading.Event | None = None,
 ) -> dict[str, Any]:
     """
     Execute a single generation job.
@@ -340,40 +657,45 @@ def _execute_job(
     for concurrent workers - they prevent double-processing of the same job.
 
     Args:
-        job_row: Row from manifest with job metadata
+        job_row: Job record (column -> value) from generations.csv, plus
+            "used_images": the manifest's used_image_1..6_path values
         paths: PathResolver instance
         adapters_cfg: Loaded adapters configuration
         worker_identity: Worker metadata dict
-        dry_run: Whether to simulate execution
+        dry_run: Whether to simulate execution (see _execute_dry_run_fast)
+        stop_event: Set by run_worker on --fail-fast; jobs not started yet
+            return as skipped instead of running
 
     Returns:
         Dict with either:
         - {"skipped": True, "reason": str} if job should be skipped
         - Complete upsert dict for generations.csv if job was executed
     """
+    if stop_event is not None and stop_event.is_set():
+        return {"skipped": True, "reason": "aborted"}
+    if dry_run:
+        return _execute_dry_run_fast(job_row, paths, worker_identity)
+
     run_id = job_row["run_id"]
     job_id = job_row["job_id"]
     algo = job_row["algo"]
     product_id = job_row["product_id"]
     variant = job_row["variant"]
 
-    # Build list of used image paths
-    used_images = []
-    for i in range(1, 7):
-        img_col = f"used_image_{i}_path"
-        if img_col in job_row and pd.notna(job_row[img_col]) and job_row[img_col]:
-            used_images.append(job_row[img_col])
+    # Build list of used image paths (manifest cells are str, or NaN when empty)
+    used_images = [img for img in job_row["used_images"] if isinstance(img, str) and img]
 
     # Get directories
     state_dir = paths.state_dir(run_id)
     out_dir = paths.outputs_dir(run_id, job_id=job_id)
 
     # Acquire job lock for state transitions
-    lock_path = paths.state_lock_path(run_id, job_id)
-    lock = FileLock(lock_path, timeout=30)
+    lock = _job_lock(paths, run_id, job_id)
 
-    # Prepare base record with all required fields
-    start_time = datetime.now(UTC)
+    # Prepare base record with all required fields. Wall-clock times are
+    # recorded for the CSV; the duration comes from the monotonic clock
+    start_wall = time.time()
+    start_mono = time.monotonic_ns()
 
     with lock:
         # Check if job is already completed/failed
@@ -395,114 +717,94 @@ def _execute_job(
     price_source = "unknown"
 
     try:
-        if dry_run:
-            # Dry-run simulation
-            gen_glb_path, previews = _simulate_dry_run(
-                product_id, variant, algo, job_id, out_dir
-            )
-            status = "completed"
-            algo_version = "dry-run"
-            price_source = "dry-run"
+        # Real execution
+        # Reload .env to pick up any API key changes
+        _reload_dotenv()
+
+        # Validate images exist
+        for img_path in used_images:
+            if not _file_exists(paths.workspace_root, img_path):
+                raise FileNotFoundError(f"Input image not found: {img_path}")
+
+        # Get adapter configuration
+        algo_cfg = adapters_cfg.get("adapters", {}).get(algo, {})
+        unit_price = float(algo_cfg.get("unit_price_usd", 0.0))
+        price_source = algo_cfg.get("price_source", "adapters.yaml")
+
+        # Get adapter class from registry
+        adapter_cls = REGISTRY.get(algo)
+        if adapter_cls is None:
+            raise AdapterPermanentError(f"Unknown adapter: {algo}")
+
+        # Create adapter instance
+        logs_dir = paths.run_root(run_id) / "logs"
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        adapter = adapter_cls(
+            cfg=algo_cfg,
+            workspace=paths.workspace_root,
+            logs_dir=logs_dir,
+        )
+
+        # Build Token for adapter
+        # Extract image suffixes from paths (e.g., _A, _B from image names)
+        img_suffixes = "-".join(
+            Path(p).stem.rsplit("_", 1)[-1]
+            for p in used_images
+            if "_" in Path(p).stem
+        ) or "default"
+
+        token = Token(
+            run_id=run_id,
+            algo=algo,
+            product_id=job_row["product_id"],
+            variant=job_row["variant"],
+            image_files=used_images,
+            img_suffixes=img_suffixes,
+            job_id=job_id,
+        )
+
+        # Execute adapter
+        exec_result = adapter.execute(token, deadline_s=480)
+        algo_version = algo_cfg.get("endpoint", algo)
+
+        # Handle result - glb_path may be URL or local path
+        glb_result = exec_result.glb_path
+        # Generate meaningful filename with metadata
+        glb_filename = _generate_glb_filename(product_id, variant, algo, job_id)
+        gen_glb_path = out_dir / glb_filename
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(glb_result, str) and glb_result.startswith("http"):
+            # Download from URL
+            with requests.get(glb_result, stream=True, timeout=120) as r:
+                r.raise_for_status()
+                with gen_glb_path.open("wb") as f:
+                    for chunk in r.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
+        elif isinstance(glb_result, Path):
+            # Copy local file
+            import shutil
+            shutil.copy2(glb_result, gen_glb_path)
         else:
-            # Real execution
-            # Reload .env to pick up any API key changes
-            _reload_dotenv()
-
-            # Validate images exist
-            for img_path in used_images:
-                img_abs = paths.workspace_root / img_path
-                if not img_abs.exists():
-                    raise FileNotFoundError(f"Input image not found: {img_path}")
-
-            # Get adapter configuration
-            algo_cfg = adapters_cfg.get("adapters", {}).get(algo, {})
-            unit_price = float(algo_cfg.get("unit_price_usd", 0.0))
-            price_source = algo_cfg.get("price_source", "adapters.yaml")
-
-            # Get adapter class from registry
-            adapter_cls = REGISTRY.get(algo)
-            if adapter_cls is None:
-                raise AdapterPermanentError(f"Unknown adapter: {algo}")
-
-            # Create adapter instance
-            logs_dir = paths.run_root(run_id) / "logs"
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            adapter = adapter_cls(
-                cfg=algo_cfg,
-                workspace=paths.workspace_root,
-                logs_dir=logs_dir,
-            )
-
-            # Build Token for adapter
-            # Extract image suffixes from paths (e.g., _A, _B from image names)
-            img_suffixes = "-".join(
-                Path(p).stem.rsplit("_", 1)[-1]
-                for p in used_images
-                if "_" in Path(p).stem
-            ) or "default"
-
-            token = Token(
-                run_id=run_id,
-                algo=algo,
-                product_id=job_row["product_id"],
-                variant=job_row["variant"],
-                image_files=used_images,
-                img_suffixes=img_suffixes,
-                job_id=job_id,
-            )
-
-            # Execute adapter
-            exec_result = adapter.execute(token, deadline_s=480)
-            algo_version = algo_cfg.get("endpoint", algo)
-
-            # Handle result - glb_path may be URL or local path
-            glb_result = exec_result.glb_path
-            # Generate meaningful filename with metadata
-            glb_filename = _generate_glb_filename(product_id, variant, algo, job_id)
-            gen_glb_path = out_dir / glb_filename
-            out_dir.mkdir(parents=True, exist_ok=True)
-
-            if isinstance(glb_result, str) and glb_result.startswith("http"):
-                # Download from URL
-                with requests.get(glb_result, stream=True, timeout=120) as r:
-                    r.raise_for_status()
-                    with gen_glb_path.open("wb") as f:
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-            elif isinstance(glb_result, Path):
-                # Copy local file
-                import shutil
-                shutil.copy2(glb_result, gen_glb_path)
-            else:
-                # Assume string path
-                import shutil
-                shutil.copy2(Path(glb_result), gen_glb_path)
-
-            status = "completed"
+            # Assume string path
+            import shutil
+            shutil.copy2(Path(glb_result), gen_glb_path)
+
+        status = "completed"
 
         # Verify output exists and is non-empty
         if status == "completed":
-            if (
-                gen_glb_path is None
-                or not gen_glb_path.exists()
-                or gen_glb_path.stat().st_size == 0
-            ):
+            glb_stat = stat_or_none(gen_glb_path) if gen_glb_path is not None else None
+            if glb_stat is None or glb_stat.st_size == 0:
                 raise RuntimeError("Generated GLB is missing or empty")
 
     except Exception as e:
-        error_msg = str(e)[:2000]  # Truncate to 2000 chars
-        if len(str(e)) > 2000:
-            error_msg += " (truncated; see error.txt)"
-
-        # Write full error to error.txt
-        error_file = state_dir / f"{job_id}.error.txt"
-        error_content = f"Error: {e}\n\nTraceback:\n{traceback.format_exc()}"
-        write_text_atomic(error_file, error_content)
+        error_msg = _record_job_error(state_dir, job_id, e)
 
     # Finalize (acquire lock for state transition)
-    end_time = datetime.now(UTC)
-    duration_s = (end_time - start_time).total_seconds()
+    duration_s = (time.monotonic_ns() - start_mono) / 1e9
+    end_wall = time.time()
 
     with lock:
         # Transition state marker
@@ -513,8 +815,8 @@ def _execute_job(
         "run_id": run_id,
         "job_id": job_id,
         "status": status,
-        "generation_start": start_time.isoformat(),
-        "generation_end": end_time.isoformat(),
+        "generation_start": datetime.fromtimestamp(start_wall, UTC).isoformat(),
+        "generation_end": datetime.fromtimestamp(end_wall, UTC).isoformat(),
         "generation_duration_s": duration_s,
         "algo_version": algo_version,
         "unit_price_usd": unit_price,
@@ -547,6 +849,28 @@ def _execute_job(
 # -------------------------
 
 
+def _make_executor(executor_kind: str, max_parallel: int) -> Executor:
+    """Create the pool jobs run on (see run_worker's executor_kind)."""
+    if executor_kind == "process":
+        # forkserver: children don't inherit the parent's threads or GPU state
+        method = "forkserver" if os.name == "posix" else "spawn"
+        return ProcessPoolExecutor(
+            max_workers=max_parallel, mp_context=multiprocessing.get_context(method)
+        )
+    return ThreadPoolExecutor(max_workers=max_parallel)
+
+
+def _flush_upsert_records(paths: PathResolver, upsert_records: list[dict[str, Any]]) -> None:
+    """Upsert the collected job records into generations.csv in one write."""
+    if not upsert_records:
+        return
+
+    import pyarrow as pa  # noqa: PLC0415
+
+    # Columnar build (all records share the same keys)
+    upsert_generations(paths.generations_csv_path(), pa.Table.from_pylist(upsert_records))
+
+
 def run_worker(
     run_id: str,
     paths: PathResolver,
@@ -557,6 +881,8 @@ def run_worker(
     dry_run: bool = False,
     fail_fast: bool = False,
     redo: bool = False,
+    executor_kind: str = "thread",
+    stale_seconds: int = 600,
 ) -> dict[str, Any]:
     """
     Execute generation jobs for a given run.
@@ -564,17 +890,28 @@ def run_worker(
     Args:
         run_id: Run identifier (required)
         paths: PathResolver instance
-        jobs: Optional glob/regex filter on job_id
+        jobs: Optional job_id filter (substring, glob with *, or re:<regex>)
         only_status: Comma-separated list of statuses to process (default: "enqueued")
         max_parallel: Maximum number of concurrent workers (default: 1)
         adapter: Force specific adapter (debug mode)
         dry_run: Simulate execution without calling adapters
         fail_fast: Stop on first failure
         redo: Clear state markers for selected jobs before execution, allowing retry
+        executor_kind: "thread" (default) or "process". Threads suit adapters
+            that mostly wait on remote APIs; use processes for CPU-bound
+            adapters, which would otherwise serialize on the GIL.
+        stale_seconds: Age after which an .inprogress marker counts as left
+            behind by a crashed worker and is removed (default 10 minutes)
 
     Returns:
         Dict with summary: processed, completed, failed, skipped
+
+    Raises:
+        ValueError: If executor_kind is not supported.
     """
+    if executor_kind not in EXECUTOR_KINDS:
+        raise ValueError(f"Unsupported executor kind: {executor_kind}")
+
     # Initialize
     worker_identity = _get_worker_identity()
     adapters_cfg = load_adapters_cfg()
@@ -595,30 +932,41 @@ def run_worker(
     if not generations_csv.exists():
         raise FileNotFoundError(f"Generations CSV not found: {generations_csv}")
 
+    # run_id/status/algo are low-cardinality: as categoricals the filters
+    # below compare integer codes instead of strings
     df_gen = pd.read_csv(
         generations_csv,
         encoding="utf-8-sig",
-        dtype={"product_id": str, "variant": str, "run_id": str, "job_id": str},
+        usecols=_GEN_COLS,
+        dtype={
+            "product_id": str,
+            "variant": str,
+            "run_id": "category",
+            "job_id": str,
+            "status": "category",
+            "algo": "category",
+        },
     )
 
-    # Filter by run_id
-    df_run = df_gen[df_gen["run_id"] == run_id].copy()
-    if df_run.empty:
+    # Combine all filters into one mask; only the final selection is copied
+    run_mask = df_gen["run_id"] == run_id
+    if not run_mask.any():
         raise ValueError(f"No jobs found for run_id: {run_id}")
 
     # Apply non-status filters first (job_id pattern, adapter)
-    df_pre_filtered = df_run.copy()
+    mask = run_mask
 
     # Filter by job_id pattern (if specified)
     if jobs:
-        # Simple substring matching for now (could extend to regex)
-        df_pre_filtered = df_pre_filtered[
-            df_pre_filtered["job_id"].str.contains(jobs, case=False, na=False)
-        ]
+        # Substring, glob (*) or "re:" regex, compiled once per pattern and
+        # shared with the compute commands; case-insensitive as before
+        job_re = job_filter_regex(jobs)
+        job_re = re.compile(job_re.pattern, job_re.flags | re.IGNORECASE)
+        mask &= df_gen["job_id"].str.contains(job_re, na=False)
 
     # Filter by adapter (if specified)
     if adapter:
-        df_pre_filtered = df_pre_filtered[df_pre_filtered["algo"] == adapter]
+        mask &= df_gen["algo"] == adapter
 
     # Count jobs that don't match status filter (already completed/failed)
     # These will be reported as "skipped" in the summary
@@ -629,30 +977,43 @@ def run_worker(
         and "failed" not in allowed_statuses
     ):
         # When only processing enqueued jobs, count completed/failed as already done
-        already_done_mask = df_pre_filtered["status"].isin(["completed", "failed"])
+        already_done_mask = mask & df_gen["status"].isin(["completed", "failed"])
         already_done_count = int(already_done_mask.sum())
 
     # Filter by status
-    df_filtered = df_pre_filtered[df_pre_filtered["status"].isin(allowed_statuses)].copy()
+    df_filtered = df_gen[mask & df_gen["status"].isin(allowed_statuses)].copy()
 
-    # Read manifest for full job details
+    # Read manifest for full job details (parquet copy preferred when present)
     manifest_path = paths.run_root(run_id) / "manifest.csv"
-    if not manifest_path.exists():
+    manifest_parquet = manifest_path.with_suffix(".parquet")
+    if manifest_parquet.exists():
+        # Only the rows of the jobs selected above (pushed down to the reader)
+        selected_ids = df_filtered["job_id"].tolist()
+        df_manifest = pd.read_parquet(
+            manifest_parquet,
+            columns=_MANIFEST_COLS,
+            filters=[("job_id", "in", selected_ids)] if selected_ids else None,
+        )
+    elif manifest_path.exists():
+        df_manifest = pd.read_csv(
+            manifest_path,
+            encoding="utf-8-sig",
+            usecols=_MANIFEST_COLS,
+            dtype=str,
+        )
+    else:
         raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-    df_manifest = pd.read_csv(
-        manifest_path,
-        encoding="utf-8-sig",
-        dtype={"product_id": str, "variant": str, "job_id": str},
-    )
-
-    # Add run_id to manifest for merging (manifest doesn't include run_id)
-    df_manifest["run_id"] = run_id
-
-    # Merge filtered generations with manifest to get full job details
-    df_jobs = df_filtered.merge(
-        df_manifest, on=["run_id", "job_id"], how="inner", suffixes=("", "_manifest")
+    # Index the manifest's image paths by job_id instead of merging frames;
+    # jobs missing from the manifest are dropped (as an inner join would)
+    manifest_images = dict(
+        zip(
+            df_manifest["job_id"],
+            df_manifest[_MANIFEST_COLS[1:]].itertuples(index=False, name=None),
+            strict=True,
+        )
     )
+    df_jobs = df_filtered[df_filtered["job_id"].isin(manifest_images.keys())]
 
     if df_jobs.empty:
         return {"processed": 0, "completed": 0, "failed": 0, "skipped": already_done_count}
@@ -661,8 +1022,22 @@ def run_worker(
     if redo:
         state_dir = paths.state_dir(run_id)
         state_dir.mkdir(parents=True, exist_ok=True)
-        for _, row in df_jobs.iterrows():
-            _clear_state_markers(state_dir, row["job_id"])
+        existing_markers = _list_state_markers(state_dir)
+        for job_id in df_jobs["job_id"]:
+            _clear_state_markers(state_dir, job_id, existing_markers)
+
+    # Remove .inprogress markers of crashed workers
+    reaped = _reap_stale_markers(paths.state_dir(run_id), stale_seconds)
+    if reaped:
+        append_log_record(
+            paths.worker_log_path(),
+            {"event": "stale_markers_reaped", "run_id": run_id, "count": reaped},
+        )
+
+    # Markers and input image folders are listed afresh for every worker run
+    _reset_state_cache(paths.state_dir(run_id))
+    with _dir_listing_guard:
+        _dir_listing_cache.clear()
 
     # Log worker start
     log_path = paths.worker_log_path()
@@ -683,93 +1058,134 @@ def run_worker(
         },
     )
 
+    # Skip jobs finished by an earlier invocation before they reach the pool
+    # (_execute_job re-checks under the job lock for concurrent workers)
+    state_map = _load_state_cache(paths.state_dir(run_id))
+    finished = [state_map.get(job_id) in ("completed", "failed") for job_id in df_jobs["job_id"]]
+    skipped_finished = sum(finished)
+    if skipped_finished:
+        df_jobs = df_jobs[[not f for f in finished]]
+
+    # With several workers, start the most expensive jobs first (longest
+    # processing time first) so slow jobs don't straggle at the end. The
+    # adapter's unit price stands in for its runtime; ties keep manifest order.
+    if max_parallel > 1:
+        unit_prices = {
+            algo: float(algo_cfg.get("unit_price_usd", 0.0))
+            for algo, algo_cfg in adapters_cfg.get("adapters", {}).items()
+        }
+        cost = df_jobs["algo"].astype(object).map(unit_prices).fillna(0.0)
+        df_jobs = df_jobs.loc[cost.sort_values(ascending=False, kind="stable").index]
+
     # Execute jobs
     processed = 0
     completed = 0
     failed = 0
-    skipped = 0
+    skipped = skipped_finished
     durations = []
     upsert_records = []  # Collect all upsert data for batch write
 
-    # Use thread pool for concurrency
-    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
-        # Submit all jobs
-        futures = {
-            executor.submit(_execute_job, row, paths, adapters_cfg, worker_identity, dry_run): row
-            for _, row in df_jobs.iterrows()
-        }
-
-        # Process results as they complete
-        for future in as_completed(futures):
-            row = futures[future]
-            job_id = row["job_id"]
-
-            try:
-                result = future.result()
-
-                if result.get("skipped"):
-                    skipped += 1
-                    continue
+    # Use thread pool for concurrency (or processes, for CPU-bound adapters).
+    # Per-job events go through one open log file, which adds the run_id.
+    # Job records are built in one pass instead of boxing every row into a
+    # Series via iterrows()
+    records = df_jobs.to_dict("records")
+    for row in records:
+        row["used_images"] = manifest_images[row["job_id"]]
+
+    job_log_writer = LogWriter(log_path, defaults={"run_id": run_id})
+    # On --fail-fast, queued thread jobs see the event and return at once;
+    # an Event cannot reach pool processes, whose queued jobs are cancelled
+    stop_event = threading.Event() if executor_kind == "thread" else None
+    try:
+        with job_log_writer as job_log, _make_executor(executor_kind, max_parallel) as executor:
 
-                # Collect upsert data for batch write
-                upsert_records.append(result)
-
-                processed += 1
-                status = result["status"]
-                duration_s = result["generation_duration_s"]
-                durations.append(duration_s)
-
-                if status == "completed":
-                    completed += 1
-                    append_log_record(
-                        log_path,
-                        {
-                            "event": "job_completed",
-                            "run_id": run_id,
-                            "job_id": job_id,
-                            "duration_s": duration_s,
-                        },
-                    )
-                elif status == "failed":
-                    failed += 1
-                    append_log_record(
-                        log_path,
-                        {
-                            "event": "job_failed",
-                            "run_id": run_id,
-                            "job_id": job_id,
-                            "error": result.get("error_msg", ""),
-                        },
-                    )
-
-                    if fail_fast:
-                        # Cancel remaining futures
-                        for f in futures:
-                            f.cancel()
-                        raise RuntimeError(f"Job {job_id} failed, stopping due to --fail-fast")
-
-            except Exception as e:
-                failed += 1
-                append_log_record(
-                    log_path,
-                    {
-                        "event": "job_crashed",
-                        "run_id": run_id,
-                        "job_id": job_id,
-                        "error": str(e),
-                    },
+            def submit(row: dict[str, Any]) -> Future:
+                return executor.submit(
+                    _execute_job, row, paths, adapters_cfg, worker_identity, dry_run,
+                    stop_event=stop_event,
                 )
 
-                if fail_fast:
-                    raise
-
-    # Batch upsert all results to generations.csv (single atomic write)
-    if upsert_records:
-        upsert_df = pd.DataFrame(upsert_records)
-        upsert_generations(
-            paths.generations_csv_path(),
-            upsert_df,
-        )
+            # Keep at most _SUBMIT_WINDOW_FACTOR * max_parallel jobs in flight and
+            # submit the next one as each finishes, so pending futures stay
+            # bounded however large the run is
+            pending_rows = iter(records)
+            in_flight = {
+                submit(row): row
+                for row in itertools.islice(pending_rows, _SUBMIT_WINDOW_FACTOR * max_parallel)
+            }
+
+            # Process results as they complete
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    row = in_flight.pop(future)
+                    job_id = row["job_id"]
+
+                    next_row = next(pending_rows, None)
+                    if next_row is not None:
+                        in_flight[submit(next_row)] = next_row
+
+                    try:
+                        result = future.result()
+
+                        if result.get("skipped"):
+                            skipped += 1
+                            continue
+
+                        # Collect upsert data for batch write
+                        upsert_records.append(result)
+
+                        processed += 1
+                        status = result["status"]
+                        duration_s = result["generation_duration_s"]
+                        durations.append(duration_s)
+
+                        if status == "completed":
+                            completed += 1
+                            job_log.write(
+                                {
+                                    "event": "job_completed",
+                                    "job_id": job_id,
+                                    "duration_s": duration_s,
+                                },
+                            )
+                        elif status == "failed":
+                            failed += 1
+                            job_log.write(
+                                {
+                                    "event": "job_failed",
+                                    "job_id": job_id,
+                                    "error": result.get("error_msg", ""),
+                                },
+                            )
+
+                            if fail_fast:
+                                # Stop queued jobs; running ones finish on exit
+                                if stop_event is not None:
+                                    stop_event.set()
+                                else:
+                                    executor.shutdown(wait=False, cancel_futures=True)
+                                raise RuntimeError(
+                                    f"Job {job_id} failed, stopping due to --fail-fast"
+                                )
+
+                    except Exception as e:
+                        failed += 1
+                        job_log.write(
+                            {
+                                "event": "job_crashed",
+                                "job_id": job_id,
+                                "error": str(e),
+                            },
+                        )
+
+                        if fail_fast:
+                            raise
+    finally:
+        # Batch upsert all results to generations.csv (single atomic write);
+        # also when --fail-fast aborts, so finished jobs are not lost
+        _flush_upsert_records(paths, upsert_records)
 
     # Log summary
     avg_duration = sum(durations) / len(durations) if durations else 0.0
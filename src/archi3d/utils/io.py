@@ -5,12 +5,14 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
 import os
+import threading
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import pandas as pd
 import yaml
@@ -24,14 +26,23 @@ def write_text(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text, encoding="utf-8", newline="\n")
 
+def stat_or_none(path: Path) -> os.stat_result | None:
+    """stat() a path, returning None if it doesn't exist (one syscall, vs exists()+stat())."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 def read_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 def write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize in one go: json.dump() issues a write() per encoder chunk
+    text = json.dumps(data, ensure_ascii=False, indent=2)
     with path.open("w", encoding="utf-8", newline="\n") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(text)
 
 def read_csv_dicts(path: Path) -> list[dict]:
     with path.open("r", encoding="utf-8-sig", newline="") as f:
@@ -46,27 +57,116 @@ def write_csv_dicts(path: Path, rows: Iterable[dict]) -> None:
             w.writeheader()
             w.writerows(rows)
 
+# pandas' default na_values, so Arrow reads null out the same cells
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+def read_csv_arrow(
+    path: Path,
+    str_cols: Iterable[str] = (),
+    usecols: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a UTF-8(-sig) CSV with pyarrow's multi-threaded parser.
+
+    Equivalent to ``pd.read_csv(path, dtype={c: str for c in str_cols},
+    usecols=usecols, encoding="utf-8-sig")`` but with numpy-backed columns
+    built from Arrow; missing values come back as None/NaN like pandas' NA
+    handling. Used for the large tables (items/generations) read per batch.
+    """
+    import pyarrow as pa  # noqa: PLC0415
+    from pyarrow import csv as pa_csv  # noqa: PLC0415
+
+    convert = pa_csv.ConvertOptions(
+        column_types={c: pa.string() for c in str_cols},
+        null_values=_PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+        include_columns=usecols,
+    )
+    return pa_csv.read_csv(path, convert_options=convert).to_pandas()
+
+def write_csv_arrow(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame as UTF-8-sig CSV with pyarrow's C++ writer.
+
+    Same layout as ``df.to_csv(path, index=False, encoding="utf-8-sig")``
+    (BOM, header, empty cells for missing values, floats and booleans
+    spelled as pandas does) but without pandas' Python-level row
+    formatting. Quoting is minimal unless some value needs quotes, in which
+    case every string is quoted. A frame Arrow cannot convert (e.g. an
+    object column mixing str and int) is written by ``df.to_csv`` instead.
+    """
+    import pyarrow as pa  # noqa: PLC0415
+    from pyarrow import csv as pa_csv  # noqa: PLC0415
+
+    df_orig = df
+    # pandas spells booleans True/False and floats via repr (1.0); Arrow
+    # would write true/false and 1
+    text_cols = {
+        c: df[c].astype(str).where(df[c].notna(), None)
+        for c in df.columns
+        if pd.api.types.is_bool_dtype(df[c]) or pd.api.types.is_float_dtype(df[c])
+    }
+    if text_cols:
+        df = df.assign(**text_cols)
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed value types in a column: keep pandas' tolerant formatting
+        df_orig.to_csv(path, index=False, encoding="utf-8-sig")
+        return
+    # Arrow always quotes header names; csv.writer quotes them like pandas
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(df.columns)
+    with path.open("wb") as f:
+        f.write(("\ufeff" + header.getvalue()).encode("utf-8"))
+        data_start = f.tell()
+        try:
+            pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(
+                include_header=False, quoting_style="none"
+            ))
+        except pa.ArrowInvalid:
+            # A value contains a delimiter, quote or newline: start over quoting strings
+            f.seek(data_start)
+            f.truncate()
+            pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(
+                include_header=False, quoting_style="needed"
+            ))
+
+# libyaml-backed safe loader/dumper when available (same output, C speed)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 def read_yaml(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 def write_yaml(path: Path, data: Any) -> None:
+    # Emit in memory, then one write (the emitter writes in small pieces)
+    text = yaml.dump(data, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="\n") as f:
-        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+        f.write(text)
 
 
 # -------------------------
 # Phase 0: Atomic I/O Utilities
 # -------------------------
 
-def write_text_atomic(path: Path, text: str) -> None:
+def write_text_atomic(path: Path, text: str, fsync: bool = True) -> None:
     """
     Write text to a file atomically using temp file + rename.
 
     Args:
         path: Target file path
         text: Text content to write
+        fsync: Flush and fsync the temp file before the rename. Pass False for
+            small advisory files written per job (state markers), where the
+            rename alone gives the needed atomicity and the fsync dominates.
 
     The write is atomic on both POSIX and Windows via os.replace().
     Creates parent directories if needed.
@@ -75,11 +175,12 @@ def write_text_atomic(path: Path, text: str) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
 
     try:
-        # Write to temp file with flush + fsync for durability
+        # Write to temp file (flush + fsync for durability unless disabled)
         with tmp_path.open("w", encoding="utf-8", newline="\n") as f:
             f.write(text)
-            f.flush()
-            os.fsync(f.fileno())
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename (replaces existing file)
         os.replace(tmp_path, path)
@@ -90,6 +191,27 @@ def write_text_atomic(path: Path, text: str) -> None:
         raise
 
 
+# Log directories already created by append_log_record (skips a mkdir per record)
+_log_dirs_seen: set[Path] = set()
+
+
+def _log_line(path: Path, record: str | dict) -> str:
+    """Create the log's directory on first use and format record as one line."""
+    if path.parent not in _log_dirs_seen:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _log_dirs_seen.add(path.parent)
+
+    # Serialize record
+    if isinstance(record, dict):
+        record_text = json.dumps(record, ensure_ascii=False)
+    else:
+        record_text = str(record)
+
+    # Add timestamp prefix
+    timestamp = datetime.now(UTC).isoformat()
+    return f"{timestamp} {record_text}\n"
+
+
 def append_log_record(path: Path, record: str | dict) -> None:
     """
     Append a log record to a file with ISO8601 timestamp prefix.
@@ -103,25 +225,60 @@ def append_log_record(path: Path, record: str | dict) -> None:
     Dict records are serialized as single-line JSON.
     Uses FileLock to prevent concurrent corruption.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    line = _log_line(path, record)
     lock_path = path.with_suffix(path.suffix + ".lock")
 
-    # Serialize record
-    if isinstance(record, dict):
-        record_text = json.dumps(record, ensure_ascii=False)
-    else:
-        record_text = str(record)
-
-    # Add timestamp prefix
-    timestamp = datetime.now(UTC).isoformat()
-    line = f"{timestamp} {record_text}\n"
-
     # Append under lock
     with FileLock(lock_path, timeout=10):
         with path.open("a", encoding="utf-8") as f:
             f.write(line)
 
 
+class LogWriter:
+    """
+    Append many records to one log, keeping the file open in between.
+
+    Use as a context manager; write() produces the same lines as
+    append_log_record, under the same FileLock, but without opening and
+    closing the log per record. The file is fsynced on exit.
+
+    Fields shared by every dict record (e.g. the run_id) can be passed once
+    as defaults: they are serialized once and lead each dict record, which
+    must not repeat their keys.
+    """
+
+    def __init__(self, path: Path, defaults: dict | None = None) -> None:
+        self.path = path
+        self._file_lock = FileLock(path.with_suffix(path.suffix + ".lock"), timeout=10)
+        self._thread_lock = threading.Lock()
+        self._file: TextIO | None = None
+        # '"key": value, ...' without braces, spliced into each dict record
+        self._defaults_json = json.dumps(defaults, ensure_ascii=False)[1:-1] if defaults else ""
+
+    def __enter__(self) -> LogWriter:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        return self
+
+    def write(self, record: str | dict) -> None:
+        """Append one record (see append_log_record)."""
+        if self._defaults_json and isinstance(record, dict):
+            record_json = json.dumps(record, ensure_ascii=False)
+            sep = ", " if record else ""
+            record = "{" + self._defaults_json + sep + record_json[1:]
+        line = _log_line(self.path, record)
+        with self._thread_lock, self._file_lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+
+
 def update_csv_atomic(
     path: Path,
     df_new: pd.DataFrame,
@@ -3,9 +3,15 @@
 
 # src/archi3d/utils/text.py
 from __future__ import annotations
-import re, hashlib, unicodedata
+import re, hashlib, logging, unicodedata
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
 
 _slug_re = re.compile(r"[^a-z0-9._-]+")
+_slug_dashes_re = re.compile(r"-{2,}")
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """
     Lowercase, keep [a-z0-9-], collapse dashes.
@@ -19,9 +25,87 @@ def slugify(text: str) -> str:
     # Remove invalid chars
     s = _slug_re.sub("-", s).strip("-._")
     # Collapse dashes
-    s = re.sub(r"-{2,}", "-", s)
+    s = _slug_dashes_re.sub("-", s)
     return s
 
 def get_stable_hash(text: str, length: int = 8) -> str:
     """Returns a stable, fixed-length hash of a string."""
-    return hashlib.blake2b(text.encode("utf-8"), digest_size=length // 2).hexdigest()
\ No newline at end of file
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=length // 2).hexdigest()
+
+_variant_drop_re = re.compile(r"[^a-z0-9\-_]")
+_variant_dashes_re = re.compile(r"-+")
+
+@lru_cache(maxsize=1024)
+def format_variant_for_filename(variant: str) -> str:
+    """
+    Format variant string for use in filenames.
+
+    Rules:
+    - Replace spaces with hyphens
+    - Lowercase for consistency
+    - Remove special characters except hyphens and underscores
+    - Use "default" if variant is empty
+
+    Examples:
+        "Curved backrest" -> "curved-backrest"
+        "Model-A" -> "model-a"
+        "" -> "default"
+    """
+    if not variant or variant.strip() == "":
+        return "default"
+
+    formatted = variant.lower().strip().replace(" ", "-")
+    formatted = _variant_drop_re.sub("", formatted)
+    formatted = _variant_dashes_re.sub("-", formatted)
+    formatted = formatted.strip("-")
+
+    return formatted if formatted else "default"
+
+def job_matches_filter(job_id: str, filter_pattern: str) -> bool:
+    """
+    Check if job_id matches the filter pattern.
+
+    Supports:
+    - Substring matching (contains)
+    - Simple glob patterns (* wildcard)
+    - Regex patterns (if pattern starts with 're:')
+
+    Args:
+        job_id: Job ID to test
+        filter_pattern: Filter pattern string
+
+    Returns:
+        True if job_id matches filter, False otherwise
+    """
+    if not filter_pattern:
+        return True
+    return job_filter_regex(filter_pattern).search(job_id) is not None
+
+# Compiled stand-in for a filter that can never match (invalid regex)
+_never_match_re = re.compile(r"(?!)")
+
+@lru_cache(maxsize=32)
+def job_filter_regex(filter_pattern: str) -> re.Pattern[str]:
+    """
+    Compile a job filter pattern into a single search regex (once per pattern).
+
+    Same semantics as job_matches_filter, expressed so that ``.search`` (or
+    ``Series.str.contains``) applies every mode: substrings are escaped and
+    globs are anchored at the start like ``re.match``. An invalid regex is
+    reported once and matches nothing.
+    """
+    # Regex pattern
+    if filter_pattern.startswith("re:"):
+        pattern = filter_pattern[3:]
+        try:
+            return re.compile(pattern)
+        except re.error:
+            logger.warning(f"Invalid regex pattern: {pattern}")
+            return _never_match_re
+
+    # Glob pattern
+    if "*" in filter_pattern:
+        return re.compile(r"\A(?:" + filter_pattern.replace("*", ".*") + ")")
+
+    # Substring matching
+    return re.compile(re.escape(filter_pattern))
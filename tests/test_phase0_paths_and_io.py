@@ -1,9 +1,12 @@
 """
-Phase 0 tests: Workspace layout (PathResolver) and atomic I/O utilities.
+Phase 0 tests: Workspace layout (PathResolver), atomic I/O utilities and
+the shared --jobs filter.
 """
 from __future__ import annotations
 
 import json
+import logging
+import re
 import tempfile
 from pathlib import Path
 
@@ -19,10 +22,13 @@ from archi3d.config.schema import (
     UserConfig,
 )
 from archi3d.utils.io import (
+    LogWriter,
     append_log_record,
     update_csv_atomic,
+    write_csv_arrow,
     write_text_atomic,
 )
+from archi3d.utils.text import job_filter_regex, job_matches_filter
 
 
 @pytest.fixture
@@ -191,6 +197,114 @@ class TestAppendLogRecord:
         assert '"event"' in lines[1]
         assert "Third message" in lines[2]
 
+    def test_log_writer_matches_append(self, temp_workspace):
+        """Test that LogWriter appends the same lines as append_log_record."""
+        log_file = temp_workspace / "logs" / "test.log"
+
+        append_log_record(log_file, "First message")
+        with LogWriter(log_file) as log:
+            log.write({"event": "second"})
+            log.write("Third message")
+
+        lines = log_file.read_text(encoding="utf-8").strip().split("\n")
+
+        assert len(lines) == 3
+        assert lines[0][:4].isdigit()
+        assert json.loads(lines[1][lines[1].index("{"):]) == {"event": "second"}
+        assert lines[2].endswith(" Third message")
+
+    def test_log_writer_defaults(self, temp_workspace):
+        """Test that LogWriter defaults lead every dict record."""
+        log_file = temp_workspace / "logs" / "test.log"
+
+        with LogWriter(log_file, defaults={"run_id": "r1"}) as log:
+            log.write({"event": "done", "job_id": "j1"})
+            log.write({})
+            log.write("Plain message")
+
+        lines = log_file.read_text(encoding="utf-8").strip().split("\n")
+
+        assert json.loads(lines[0][lines[0].index("{"):]) == {
+            "run_id": "r1",
+            "event": "done",
+            "job_id": "j1",
+        }
+        assert json.loads(lines[1][lines[1].index("{"):]) == {"run_id": "r1"}
+        assert lines[2].endswith(" Plain message")
+
+
+class TestWriteCsvArrow:
+    """Test the Arrow-backed CSV writer."""
+
+    def test_matches_pandas(self, temp_workspace):
+        """Test that unquoted output is byte-identical to DataFrame.to_csv."""
+        df = pd.DataFrame({
+            "name": ["a", "b", None],
+            "score": [1.0, 0.5, None],
+            "ok": [True, False, True],
+        })
+        arrow_file = temp_workspace / "arrow.csv"
+        pandas_file = temp_workspace / "pandas.csv"
+
+        write_csv_arrow(df, arrow_file)
+        df.to_csv(pandas_file, index=False, encoding="utf-8-sig")
+
+        assert arrow_file.read_bytes() == pandas_file.read_bytes()
+
+    def test_mixed_types_fall_back_to_pandas(self, temp_workspace):
+        """Test that a column mixing str and int is still written."""
+        df = pd.DataFrame({"manufacturer": ["Acme", 4021]})
+        csv_file = temp_workspace / "mixed.csv"
+
+        write_csv_arrow(df, csv_file)
+
+        df_read = pd.read_csv(csv_file, encoding="utf-8-sig", dtype=str)
+        assert df_read["manufacturer"].tolist() == ["Acme", "4021"]
+
+
+class TestJobFilterRegex:
+    """Test the shared --jobs filter semantics."""
+
+    def test_substring(self):
+        """Test that plain patterns match anywhere, with regex characters literal."""
+        job_re = job_filter_regex("ab.c")
+        assert job_re.search("xxab.cyy")
+        assert not job_re.search("xxabXcyy")
+
+    def test_glob_anchored_at_start(self):
+        """Test that * globs match from the start of the job_id only."""
+        job_re = job_filter_regex("ab*9")
+        assert job_re.search("ab1239")
+        assert job_re.search("ab12390")  # Open at the end, like re.match
+        assert not job_re.search("xab1239")
+        assert job_filter_regex("*9").search("xab9")
+
+    def test_regex_prefix(self):
+        """Test that 're:' patterns are used as regular expressions."""
+        job_re = job_filter_regex("re:^a[0-9]+$")
+        assert job_re.search("a123")
+        assert not job_re.search("a12b")
+
+    def test_invalid_regex_matches_nothing(self, caplog):
+        """Test that an invalid regex is warned about once and matches nothing."""
+        job_filter_regex.cache_clear()
+        with caplog.at_level(logging.WARNING, logger="archi3d.utils.text"):
+            assert not job_filter_regex("re:(").search("anything")
+            assert not job_matches_filter("anything", "re:(")
+        assert sum("Invalid regex" in r.message for r in caplog.records) == 1
+
+    def test_case_insensitive_variant(self):
+        """Test the worker's variant: the same pattern recompiled with IGNORECASE."""
+        for pattern in ("AB", "AB*", "re:^AB"):
+            job_re = job_filter_regex(pattern)
+            assert not job_re.search("abcd")
+            job_re = re.compile(job_re.pattern, job_re.flags | re.IGNORECASE)
+            assert job_re.search("abcd")
+
+    def test_empty_filter_matches_all(self):
+        """Test that an empty filter accepts every job."""
+        assert job_matches_filter("abcd", "")
+
 
 class TestUpdateCsvAtomic:
     """Test atomic CSV upsert functionality."""
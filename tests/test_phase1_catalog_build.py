@@ -18,7 +18,7 @@ from archi3d.config.schema import (
     Thresholds,
     UserConfig,
 )
-from archi3d.db.catalog import build_catalog
+from archi3d.db.catalog import _image_tag, build_catalog
 
 
 @pytest.fixture
@@ -164,6 +164,15 @@ class TestCatalogBuild:
         too_many_issues = df_issues[df_issues["issue"] == "too_many_images"]
         assert len(too_many_issues) >= 1  # Should have "too_many_images" issue
 
+    def test_image_tag(self):
+        """Test 2b: Tag detection on the stem keeps the established image order."""
+        # A tag directly before the extension is not seen in the stem
+        assert _image_tag("photo_A") is None
+        assert _image_tag("photo_b.v2") == "B"
+        assert _image_tag("photo_G.v2") is None
+        assert _image_tag("photo_A.") is None
+        assert _image_tag("photo") is None
+
     def test_gt_preference_and_multiple_candidates(self, temp_workspace, path_resolver):
         """Test 3: GT selection prefers .glb over .fbx, warns on multiple candidates."""
         # Setup: dataset/3003/ with .fbx and multiple .glb files
@@ -263,6 +272,38 @@ class TestCatalogBuild:
         assert df_items.loc[0, "category_l3"] == "Categoria3"
         assert df_items.loc[0, "source_json_present"] == True
 
+    def test_non_string_enrichment_value(self, temp_workspace, path_resolver):
+        """Test 4c: A numeric manufacturer name next to a textual one is kept."""
+        products_json = temp_workspace / "products-with-3d.json"
+        products_data = [
+            {"ProductId": "4010", "Manufacturer": {"Name": "Test Manufacturer"}},
+            {"ProductId": "4011", "Manufacturer": {"Name": 4021}},
+        ]
+        products_json.write_text(json.dumps(products_data), encoding="utf-8")
+
+        # A copy left by an earlier build must not shadow the new items.csv
+        path_resolver.items_parquet_path().write_text("stale")
+
+        for product_id in ("4010", "4011"):
+            item_dir = temp_workspace / "dataset" / product_id
+            (item_dir / "images").mkdir(parents=True)
+            (item_dir / "gt").mkdir(parents=True)
+            (item_dir / "images" / "image.jpg").write_text("")
+            (item_dir / "gt" / "model.glb").write_text("")
+
+        items_count, _ = build_catalog(
+            dataset_path=temp_workspace / "dataset",
+            products_json_path=products_json,
+            paths=path_resolver
+        )
+
+        assert items_count == 2
+        df_items = pd.read_csv(path_resolver.items_csv_path(), encoding="utf-8-sig", dtype=str)
+        manufacturers = dict(zip(df_items["product_id"], df_items["manufacturer"], strict=True))
+        assert manufacturers == {"4010": "Test Manufacturer", "4011": "4021"}
+        # Arrow cannot store the mixed column: batch creation falls back to items.csv
+        assert not path_resolver.items_parquet_path().exists()
+
     def test_missing_enrichment_fields(self, temp_workspace, path_resolver):
         """Test 4b: Missing enrichment fields produce issues."""
         # Setup: Create products JSON with missing fields
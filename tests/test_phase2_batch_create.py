@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import json
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -18,7 +19,12 @@ import pytest
 from archi3d.config.loader import load_config
 from archi3d.config.paths import PathResolver
 from archi3d.config.schema import EffectiveConfig, UserConfig
-from archi3d.db.generations import compute_image_set_hash, compute_job_id
+from archi3d.db.generations import (
+    compute_image_set_hash,
+    compute_image_set_hashes,
+    compute_job_id,
+    compute_job_ids,
+)
 from archi3d.orchestrator.batch import create_batch
 from archi3d.utils.io import append_log_record
 
@@ -397,6 +403,31 @@ def test_job_identity_helpers():
     assert len(job_id1) == 12
 
 
+def test_job_identity_batch_helpers():
+    """Test the batch job identity helpers match the scalar helpers."""
+    image_lists = [
+        ["dataset/100001/images/img_A.jpg", "dataset/100001/images/img_B.jpg"],
+        ["dataset/100003/images/img1.jpg"],
+        [],
+    ]
+    hashes = compute_image_set_hashes(image_lists)
+    assert hashes == [compute_image_set_hash(imgs) for imgs in image_lists]
+
+    df = pd.DataFrame(
+        {
+            "product_id": ["100001", "100003", "100004"],
+            "variant": ["default", "Variant A", ""],
+            "algo": ["tripo3d_v2p5", "trellis_single", "tripo3d_v2p5"],
+            "image_set_hash": hashes,
+        }
+    )
+    job_ids = compute_job_ids(df["product_id"], df["variant"], df["algo"], df["image_set_hash"])
+    assert job_ids == [
+        compute_job_id(r.product_id, r.variant, r.algo, r.image_set_hash)
+        for r in df.itertuples()
+    ]
+
+
 # -------------------------
 # Test 7: Limit parameter
 # -------------------------
@@ -420,3 +451,107 @@ def test_batch_create_limit(paths, sample_items_csv):
     generations_csv = paths.generations_csv_path()
     df = pd.read_csv(generations_csv, encoding="utf-8-sig")
     assert len(df) == 1
+
+
+# -------------------------
+# Test 8: Parquet manifest
+# -------------------------
+
+def test_batch_create_parquet_manifest(paths, sample_items_csv):
+    """Parquet manifest is written next to the CSV and matches it."""
+    summary = create_batch(
+        run_id="test-run-parquet",
+        algos=["tripo3d_v2p5"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        manifest_format="parquet",
+    )
+    assert summary["enqueued"] == 2
+
+    run_root = paths.run_root("test-run-parquet")
+    parquet_df = pd.read_parquet(run_root / "manifest.parquet")
+    csv_df = pd.read_csv(
+        run_root / "manifest.csv",
+        dtype={"product_id": str, "variant": str, "job_id": str},
+        encoding="utf-8-sig",
+    )
+    assert list(parquet_df.columns) == list(csv_df.columns)
+    assert parquet_df["job_id"].tolist() == csv_df["job_id"].tolist()
+    assert isinstance(parquet_df["algo"].dtype, pd.CategoricalDtype)
+
+    with pytest.raises(ValueError, match="manifest format"):
+        create_batch(
+            run_id="test-run-parquet",
+            algos=["tripo3d_v2p5"],
+            paths=paths,
+            manifest_format="feather",
+        )
+
+
+# -------------------------
+# Test 9: Parquet items catalog
+# -------------------------
+
+def test_batch_create_reads_items_parquet(paths, sample_items_csv):
+    """items.parquet is preferred when current; a newer items.csv wins."""
+    items_df = pd.read_csv(
+        sample_items_csv, dtype={"product_id": str, "variant": str}, encoding="utf-8-sig"
+    ).fillna("")
+    # Parquet copy holds only the first item
+    items_df.head(1).to_parquet(paths.items_parquet_path(), index=False)
+
+    summary = create_batch(
+        run_id="test-run-items-parquet",
+        algos=["tripo3d_v2p5"],
+        paths=paths,
+        dry_run=True,
+    )
+    assert summary["candidates"] == 1
+
+    # Touch items.csv so the parquet copy is stale and ignored
+    st = paths.items_parquet_path().stat()
+    os.utime(sample_items_csv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    summary = create_batch(
+        run_id="test-run-items-parquet",
+        algos=["tripo3d_v2p5"],
+        paths=paths,
+        dry_run=True,
+    )
+    assert summary["candidates"] == 3
+
+
+def test_batch_create_items_parquet_matches_csv_with_nulls(paths, sample_items_csv):
+    """A null enrichment field gives the same batch from items.parquet as from items.csv."""
+    items_df = pd.read_csv(
+        sample_items_csv, dtype={"product_id": str, "variant": str}, encoding="utf-8-sig"
+    ).fillna("")
+    # catalog build stores None for e.g. a null Manufacturer.Name
+    items_df["manufacturer"] = items_df["manufacturer"].astype(object)
+    items_df.loc[0, "manufacturer"] = None
+    items_df.to_csv(sample_items_csv, index=False, encoding="utf-8-sig")
+    items_df.to_parquet(paths.items_parquet_path(), index=False)
+
+    def run_batch(run_id):
+        create_batch(run_id=run_id, algos=["tripo3d_v2p5"], paths=paths, dry_run=False)
+        # keep_default_na=False: a literal "None" must not read back as missing
+        manifest = pd.read_csv(
+            paths.run_root(run_id) / "manifest.csv",
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8-sig",
+        )
+        generations = pd.read_csv(
+            paths.generations_csv_path(), dtype=str, keep_default_na=False, encoding="utf-8-sig"
+        )
+        rows = generations[generations["run_id"] == run_id]
+        return manifest, rows["manufacturer"].tolist()
+
+    manifest_parquet, manufacturers_parquet = run_batch("test-run-nulls-parquet")
+    paths.items_parquet_path().unlink()
+    manifest_csv, manufacturers_csv = run_batch("test-run-nulls-csv")
+
+    pd.testing.assert_frame_equal(manifest_parquet, manifest_csv)
+    assert manufacturers_parquet == manufacturers_csv
+    assert "None" not in manufacturers_parquet
+    assert "" in manufacturers_parquet
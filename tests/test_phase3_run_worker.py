@@ -24,6 +24,7 @@ from archi3d.config.loader import load_config
 from archi3d.config.paths import PathResolver
 from archi3d.config.schema import EffectiveConfig, GlobalConfig, UserConfig
 from archi3d.db.generations import compute_image_set_hash, compute_job_id, upsert_generations
+from archi3d.orchestrator import worker as worker_module
 from archi3d.orchestrator.batch import create_batch
 from archi3d.orchestrator.worker import run_worker
 
@@ -33,6 +34,12 @@ from archi3d.orchestrator.worker import run_worker
 # -------------------------
 
 
+@pytest.fixture(autouse=True)
+def no_dry_run_sleep(monkeypatch):
+    """Drop the simulated per-job latency of dry runs."""
+    monkeypatch.setenv("ARCHI3D_DRY_RUN_SLEEP", "0")
+
+
 @pytest.fixture
 def temp_workspace():
     """Create a temporary workspace for testing."""
@@ -287,6 +294,40 @@ def test_real_run_with_failure(paths: PathResolver, sample_items):
     assert failed_marker.exists()
 
 
+def test_dry_run_failure_recorded(paths: PathResolver, sample_items, monkeypatch):
+    """Test that a dry-run simulation error is recorded as a failed job."""
+    run_id = "test-dry-failure-2025-01-01"
+
+    create_batch(
+        run_id=run_id,
+        algos=["test_algo_1"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        limit=1,
+        dry_run=False,
+    )
+
+    def disk_error(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(worker_module, "_simulate_dry_run", disk_error)
+
+    result = run_worker(run_id=run_id, paths=paths, dry_run=True)
+
+    assert result["processed"] == 1
+    assert result["failed"] == 1
+
+    gen_csv = paths.generations_csv_path()
+    df_gen = pd.read_csv(gen_csv, encoding="utf-8-sig", dtype={"product_id": str, "job_id": str})
+    row = df_gen[df_gen["run_id"] == run_id].iloc[0]
+    assert row["status"] == "failed"
+    assert "No space left on device" in row["error_msg"]
+
+    state_dir = paths.state_dir(run_id)
+    assert (state_dir / f"{row['job_id']}.error.txt").exists()
+    assert (state_dir / f"{row['job_id']}.failed").exists()
+
+
 # -------------------------
 # Test 3: Resumability
 # -------------------------
@@ -330,6 +371,37 @@ def test_resumability(paths: PathResolver, sample_items):
     assert result2["skipped"] == 3
 
 
+def test_finished_markers_skip_before_submit(
+    paths: PathResolver, sample_items, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that jobs with completed markers are never submitted."""
+    import archi3d.orchestrator.worker as worker_module
+
+    run_id = "test-resume-markers-2025-01-01"
+
+    create_batch(
+        run_id=run_id,
+        algos=["test_algo_1"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        limit=3,
+        dry_run=False,
+    )
+    run_worker(run_id=run_id, paths=paths, dry_run=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("finished job submitted")
+
+    monkeypatch.setattr(worker_module, "_execute_job", fail)
+
+    # Selecting completed rows again (without --redo) finds their markers
+    result = run_worker(run_id=run_id, paths=paths, only_status="completed", dry_run=True)
+
+    assert result["processed"] == 0
+    assert result["failed"] == 0
+    assert result["skipped"] == 3
+
+
 # -------------------------
 # Test 4: Concurrency
 # -------------------------
@@ -375,6 +447,72 @@ def test_concurrency(paths: PathResolver, sample_items):
     assert "lock" not in log_content.lower() or "timeout" not in log_content.lower()
 
 
+def test_concurrency_process_pool(paths: PathResolver, sample_items):
+    """Test concurrent execution with a process pool."""
+    run_id = "test-process-pool-2025-01-01"
+
+    summary = create_batch(
+        run_id=run_id,
+        algos=["test_algo_1"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        dry_run=False,
+    )
+    assert summary["enqueued"] == 3
+
+    result = run_worker(
+        run_id=run_id,
+        paths=paths,
+        max_parallel=2,
+        dry_run=True,
+        executor_kind="process",
+    )
+
+    assert result["processed"] == 3
+    assert result["completed"] == 3
+    assert result["failed"] == 0
+
+    # Results from the child processes reach generations.csv
+    df = pd.read_csv(paths.generations_csv_path(), encoding="utf-8-sig")
+    assert (df[df["run_id"] == run_id]["status"] == "completed").all()
+
+
+def test_stale_inprogress_markers_reaped(paths: PathResolver, sample_items):
+    """Test that inprogress markers of crashed workers are removed."""
+    import os
+
+    run_id = "test-stale-markers-2025-01-01"
+
+    create_batch(
+        run_id=run_id,
+        algos=["test_algo_1"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        dry_run=False,
+    )
+
+    state_dir = paths.state_dir(run_id)
+    stale = state_dir / "crashed.inprogress"
+    stale.write_text("timestamp: 2025-01-01T00:00:00+00:00\n", encoding="utf-8")
+    old = time.time() - 3600
+    os.utime(stale, (old, old))
+    fresh = state_dir / "running.inprogress"
+    fresh.write_text("timestamp: 2025-01-01T00:00:00+00:00\n", encoding="utf-8")
+
+    run_worker(run_id=run_id, paths=paths, dry_run=True, stale_seconds=600)
+
+    assert not stale.exists()
+    assert fresh.exists()
+    log_content = paths.worker_log_path().read_text(encoding="utf-8")
+    assert "stale_markers_reaped" in log_content
+
+
+def test_unknown_executor_kind(paths: PathResolver, sample_items):
+    """Test that an unsupported executor kind is rejected."""
+    with pytest.raises(ValueError, match="Unsupported executor kind"):
+        run_worker(run_id="any-run", paths=paths, executor_kind="fiber")
+
+
 # -------------------------
 # Test 5: Path Relativity & Idempotency
 # -------------------------
@@ -482,6 +620,33 @@ def test_job_filter(paths: PathResolver, sample_items):
     assert result["completed"] >= 1
 
 
+def test_job_filter_case_insensitive(paths: PathResolver, sample_items):
+    """Test --jobs matches job_ids regardless of case in the worker."""
+    run_id = "test-filter-case-2025-01-01"
+
+    create_batch(
+        run_id=run_id,
+        algos=["test_algo_1"],
+        paths=paths,
+        image_policy="use_up_to_6",
+        dry_run=False,
+    )
+
+    gen_csv = paths.generations_csv_path()
+    df_gen = pd.read_csv(gen_csv, encoding="utf-8-sig", dtype={"product_id": str, "job_id": str})
+    first_job_id = df_gen[df_gen["run_id"] == run_id].iloc[0]["job_id"]
+
+    result = run_worker(
+        run_id=run_id,
+        paths=paths,
+        jobs=f"re:^{first_job_id.upper()}$",
+        dry_run=True,
+    )
+
+    assert result["processed"] == 1
+    assert result["completed"] == 1
+
+
 # -------------------------
 # Test 7: Fail Fast
 # -------------------------
@@ -519,6 +684,11 @@ def test_fail_fast(paths: PathResolver, sample_items):
             fail_fast=True,
         )
 
+    # The failure collected before the abort is still written
+    df_gen = pd.read_csv(gen_csv, encoding="utf-8-sig", dtype={"product_id": str, "job_id": str})
+    df_run = df_gen[df_gen["run_id"] == run_id]
+    assert (df_run["status"] == "failed").sum() == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
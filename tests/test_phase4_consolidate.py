@@ -424,6 +424,69 @@ def test_consolidate_idempotent(temp_workspace: PathResolver):
     assert summary2["upsert_updated"] <= 1
 
 
+def test_consolidate_unchanged_rerun_uses_stamp(
+    temp_workspace: PathResolver, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test 6b: A re-run over unchanged on-disk state returns the recorded summary.
+
+    Expected: Once a run changes nothing, the next run skips reconciliation;
+    removing an output invalidates the stamp.
+    """
+    import shutil
+
+    from archi3d.orchestrator import consolidate as consolidate_module
+
+    paths = temp_workspace
+    run_id = "test-run-stamp"
+
+    job1 = _create_test_job_data(
+        paths, run_id, "job001", "completed", has_marker=True, has_glb=True
+    )
+    generations_csv = paths.generations_csv_path()
+    pd.DataFrame([job1]).to_csv(generations_csv, index=False, encoding="utf-8-sig")
+
+    # First run reconciles, second run changes nothing and records the stamp
+    consolidate(run_id=run_id, paths=paths, dry_run=False)
+    summary2 = consolidate(run_id=run_id, paths=paths, dry_run=False)
+    assert (paths.run_dir(run_id) / "consolidate.stamp.json").exists()
+
+    # Unchanged state: no evidence is gathered
+    def fail(*args, **kwargs):
+        raise AssertionError("evidence gathered for unchanged state")
+
+    with monkeypatch.context() as m:
+        m.setattr(consolidate_module, "_gather_evidence", fail)
+        summary3 = consolidate(run_id=run_id, paths=paths, dry_run=False)
+    for key in ("considered", "unchanged", "status_histogram_after"):
+        assert summary3[key] == summary2[key]
+
+    # An output rewritten in place (directory mtime unchanged) is picked up
+    job_dir = paths.outputs_dir(run_id) / "job001"
+    dir_mtime_ns = job_dir.stat().st_mtime_ns
+    glb_path = next(job_dir.glob("*.glb"))
+    with glb_path.open("r+b") as f:
+        f.truncate(0)
+    assert job_dir.stat().st_mtime_ns == dir_mtime_ns
+
+    gathered = []
+    with monkeypatch.context() as m:
+        real_gather = consolidate_module._gather_evidence
+
+        def spy(*args, **kwargs):
+            gathered.append(args[0]["job_id"])
+            return real_gather(*args, **kwargs)
+
+        m.setattr(consolidate_module, "_gather_evidence", spy)
+        consolidate(run_id=run_id, paths=paths, dry_run=False)
+    assert gathered == ["job001"]
+
+    # Removing the job's outputs is picked up again
+    shutil.rmtree(job_dir)
+    summary4 = consolidate(run_id=run_id, paths=paths, dry_run=False)
+    assert summary4["downgraded_missing_output"] == 1
+
+
 def test_consolidate_no_csv_exists(temp_workspace: PathResolver):
     """
     Test 7 (bonus): Handle case where generations.csv doesn't exist yet.
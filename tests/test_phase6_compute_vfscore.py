@@ -8,11 +8,13 @@ Tests cover:
 4. Redo mode (re-run with --redo should recompute)
 5. Concurrency and timeout (parallel processing with timeout handling)
 6. Image source selection (used_image_* vs source_image_* columns)
+7. Adapter helpers (payload normalization, reference filtering, CLI invocation)
 """
 
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -21,8 +23,17 @@ import pytest
 
 from archi3d.config.loader import load_config
 from archi3d.config.paths import PathResolver
+from archi3d.metrics import vfscore_adapter
 from archi3d.metrics.vfscore import compute_vfscore
-from archi3d.metrics.vfscore_adapter import VFScoreResponse
+from archi3d.metrics.vfscore_adapter import (
+    VFScoreRequest,
+    VFScoreResponse,
+    _filter_existing_refs,
+    _normalize_payload,
+    _read_log_tail,
+    _try_cli_invocation,
+    _vfscore_cli_prefix,
+)
 
 
 @pytest.fixture
@@ -560,3 +571,123 @@ def test_adapter_error_handling(temp_workspace: PathResolver):
     row = df_updated.iloc[0]
     assert row["vf_status"] == "error"
     assert "invalid mesh topology" in row["vf_error"]
+
+
+def test_normalize_payload_canonical_fast_path():
+    """
+    Test 10: A normalized payload normalizes to an equal dict.
+
+    The payload carries no private tag, so result.json keeps its schema.
+    """
+    raw = {"vfscore_overall_median": 0.8, "lpips_distance": 0.2, "version": "1.0"}
+
+    payload, *_ = _normalize_payload(raw)
+    again, version, config_hash, render_s, scoring_s = _normalize_payload(payload)
+
+    assert again is payload  # Fast path
+    assert again == payload
+    assert not any(key.startswith("_") for key in payload)
+    assert (version, config_hash, render_s, scoring_s) == (None, None, None, None)
+    # Same result as normalizing a copy that misses the fast path
+    assert _normalize_payload(dict(reversed(payload.items())))[0] == payload
+
+
+def test_normalize_payload_fields_and_siblings():
+    """Test 11: Canonical keys are projected, siblings returned alongside."""
+    raw = {
+        "vfscore_overall_median": 0.8,
+        "unknown_field": 1,
+        "version": "2.1",
+        "config_hash": "abc",
+        "render_runtime_s": 3.0,
+        "scoring_runtime_s": 1.5,
+    }
+
+    payload, version, config_hash, render_s, scoring_s = _normalize_payload(raw)
+
+    assert (version, config_hash, render_s, scoring_s) == ("2.1", "abc", 3.0, 1.5)
+    assert list(payload) == list(vfscore_adapter._CANONICAL_KEYS)
+    assert payload["vfscore_overall_median"] == 0.8
+    assert payload["iou"] is None
+    assert payload["render_settings"]["engine"] == "pyrender"
+    assert "unknown_field" not in payload and "version" not in payload
+
+
+def test_normalize_payload_fresh_mutable_defaults():
+    """Test 12: Default lists and dicts are not shared between payloads."""
+    first, *_ = _normalize_payload({})
+    second, *_ = _normalize_payload({})
+
+    first["scores_all"].append(1.0)
+    first["vf_subscores_median"]["finish"] = 0.5
+    first["render_settings"]["seed"] = 7
+
+    assert second["scores_all"] == []
+    assert second["vf_subscores_median"]["finish"] is None
+    assert second["render_settings"]["seed"] is None
+
+
+def test_filter_existing_refs(tmp_path: Path):
+    """Test 13: Missing references are dropped, order is preserved."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "2.png").write_text("")
+    (tmp_path / "a" / "1.png").write_text("")
+    (tmp_path / "b" / "3.png").write_text("")
+
+    refs = [
+        tmp_path / "a" / "2.png",
+        tmp_path / "missing_dir" / "x.png",
+        tmp_path / "b" / "3.png",
+        tmp_path / "a" / "gone.png",
+        tmp_path / "a" / "1.png",
+    ]
+
+    assert _filter_existing_refs(refs) == [refs[0], refs[2], refs[4]]
+
+
+def test_read_log_tail(tmp_path: Path):
+    """Test 14: Only the last bytes of the stderr log are returned."""
+    log = tmp_path / "vfscore.stderr.log"
+    log.write_bytes(b"x" * 100 + b"tail end")
+
+    assert _read_log_tail(log, 8) == "tail end"
+    assert _read_log_tail(log, 10_000) == "x" * 100 + "tail end"
+    assert _read_log_tail(tmp_path / "missing.log", 8) == ""
+
+
+def test_cli_failure_reports_only_this_run_stderr(tmp_path: Path):
+    """Test 15: A failing CLI run reports its own stderr, not earlier runs'."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "vfscore.stderr.log").write_text("stale output from an earlier run")
+    req = VFScoreRequest(
+        cand_glb=tmp_path / "cand.glb",
+        ref_images=[tmp_path / "ref.png"],
+        out_dir=out_dir,
+        repeats=1,
+    )
+    fake_cli = (sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)")
+
+    with patch.object(vfscore_adapter, "_vfscore_cli_prefix", return_value=fake_cli):
+        response = _try_cli_invocation(req)
+
+    assert not response.ok
+    assert response.error == "VFScore failed (exit 3): boom"
+
+
+def test_vfscore_cli_prefix_resolution():
+    """Test 16: The console script is preferred, else this interpreter runs -m vfscore."""
+    _vfscore_cli_prefix.cache_clear()
+    try:
+        with patch("shutil.which", return_value="/usr/bin/vfscore"):
+            assert _vfscore_cli_prefix() == ("/usr/bin/vfscore",)
+            # Cached: later lookups do not search PATH again
+            with patch("shutil.which", return_value=None):
+                assert _vfscore_cli_prefix() == ("/usr/bin/vfscore",)
+
+        _vfscore_cli_prefix.cache_clear()
+        with patch("shutil.which", return_value=None):
+            assert _vfscore_cli_prefix() == (sys.executable, "-m", "vfscore")
+    finally:
+        _vfscore_cli_prefix.cache_clear()